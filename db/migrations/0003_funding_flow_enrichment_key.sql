@@ -0,0 +1,49 @@
+BEGIN;
+
+-- Norad/OECD enrichment rows are identified by recipient, year, channel and amount.
+-- Collapse any duplicates left by earlier runs onto the lowest id before enforcing
+-- that as a unique key, moving their source-document links to the kept row first.
+CREATE TEMP TABLE tmp_funding_flow_enrichment_duplicate ON COMMIT DROP AS
+SELECT id, keep_id
+FROM (
+  SELECT
+    id,
+    min(id) OVER (
+      PARTITION BY
+        recipient_organization_id,
+        fiscal_year,
+        funding_channel,
+        amount_nok,
+        amount_original,
+        currency_code
+    ) AS keep_id
+  FROM funding_flow
+  WHERE donor_country_code = 'NO'
+    AND (funding_channel LIKE 'NORAD partner_sid=%' OR funding_channel = 'OECD DAC2A recipient proxy')
+) AS enrichment
+WHERE id <> keep_id;
+
+INSERT INTO funding_flow_source_document (funding_flow_id, source_document_id, relation_type)
+SELECT d.keep_id, l.source_document_id, l.relation_type
+FROM tmp_funding_flow_enrichment_duplicate d
+JOIN funding_flow_source_document l ON l.funding_flow_id = d.id
+ON CONFLICT DO NOTHING;
+
+DELETE FROM funding_flow f
+USING tmp_funding_flow_enrichment_duplicate d
+WHERE f.id = d.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_funding_flow_enrichment
+  ON funding_flow (
+    recipient_organization_id,
+    fiscal_year,
+    funding_channel,
+    amount_nok,
+    amount_original,
+    currency_code
+  )
+  NULLS NOT DISTINCT
+  WHERE donor_country_code = 'NO'
+    AND (funding_channel LIKE 'NORAD partner_sid=%' OR funding_channel = 'OECD DAC2A recipient proxy');
+
+COMMIT;
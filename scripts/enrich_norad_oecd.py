@@ -2,20 +2,24 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import sys
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
 from typing import Any
 from urllib.parse import urlencode
-import xml.etree.ElementTree as ET
 
 import psycopg
 import requests
 from dotenv import load_dotenv
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, tuple_row
+from requests.adapters import HTTPAdapter
 
 NORAD_BASE = "https://apim-br-online-prod.azure-api.net/resultatportal-prod-api-dotnet"
 NORAD_FUNCTION_KEY_DEFAULT = ""
@@ -33,6 +37,12 @@ OECD_DAC2_DATA_TEMPLATE = (
     "OECD.DCD.FSD,DSD_DAC2@DF_DAC2A,1.4/{key}?startPeriod={start_year}&endPeriod={end_year}"
 )
 
+HTTP_POOL_SIZE = 16
+
+# Shared session so Norad/OECD requests reuse pooled TLS connections.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+
 XML_NS = {
     "m": "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message",
     "g": "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic",
@@ -61,6 +71,15 @@ STOPWORDS = {
     "nations",
 }
 
+PAREN_RE = re.compile(r"\([^)]*\)")
+NAME_KEEP_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789æøå-")
+
+TOKEN_IDS: dict[str, int] = {}
+
+# similarity_prepared() weighs sequence ratio 0.65 and token Jaccard 0.35, plus a 0.1
+# containment boost; without a shared token the Jaccard term is zero.
+MAX_SCORE_WITHOUT_SHARED_TOKEN = 0.65 + 0.1
+
 COUNTRY_HINT_TO_ISO3 = {
     "kenya": "KEN",
     "nairobi": "KEN",
@@ -87,6 +106,22 @@ COUNTRY_HINT_TO_ISO3 = {
     "norway": "NOR",
 }
 
+# Any-hint prefilter: one C-level scan rejects HQ texts with no hint at all.
+COUNTRY_HINT_RE = re.compile("|".join(re.escape(hint) for hint in COUNTRY_HINT_TO_ISO3))
+
+
+class NameCharTable(dict):
+    """str.translate table mapping every char outside [a-z0-9æøå\\s-] to a space."""
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        value = char if char in NAME_KEEP_CHARS or char.isspace() else " "
+        self[code] = value
+        return value
+
+
+NAME_CHAR_TABLE = NameCharTable()
+
 
 @dataclass(slots=True)
 class Organization:
@@ -109,6 +144,43 @@ class MatchResult:
     name: str
 
 
+@dataclass(slots=True, frozen=True)
+class PreparedName:
+    norm: str
+    tokens: frozenset[str]
+    # Bitmap over TOKEN_IDS, so Jaccard is two bit_count() calls.
+    token_bits: int
+
+
+@dataclass(slots=True)
+class MatchCandidate:
+    code: str
+    name: str
+    names: list[PreparedName]
+    # One matcher per alias with the alias as seq2, so difflib's index of
+    # the candidate side is built once per run instead of once per pair.
+    matchers: list[SequenceMatcher]
+
+
+@dataclass(slots=True)
+class MatchIndex:
+    candidates: list[MatchCandidate]
+    by_token: dict[str, list[int]]
+
+
+@dataclass(slots=True)
+class EnrichedFlow:
+    recipient_organization_id: int
+    fiscal_year: int | None
+    funding_channel: str
+    amount_nok: float | None
+    amount_original: float | None
+    currency_code: str | None
+    notes: str | None
+    source_document_id: int | None
+    relation_type: str
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Enrich funding_flow with Norad API and OECD DAC2A public data."
@@ -127,50 +199,91 @@ def parse_args() -> argparse.Namespace:
         default=0.78,
         help="Minimum fuzzy score (0-1) for OECD recipient-code matching.",
     )
+    parser.add_argument(
+        "--http-workers",
+        type=int,
+        default=8,
+        help="Concurrent API requests when fetching per-match Norad/OECD data.",
+    )
     parser.add_argument("--dry-run", action="store_true")
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=100_000)
 def normalize_name(text: str) -> str:
     text = text.lower()
     text = text.replace("&", " and ")
-    text = re.sub(r"\([^)]*\)", " ", text)
-    text = re.sub(r"[^a-z0-9æøå\s-]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    text = PAREN_RE.sub(" ", text)
+    return " ".join(text.translate(NAME_CHAR_TABLE).split())
 
 
-def token_set(text: str) -> set[str]:
-    tokens = {
+@functools.lru_cache(maxsize=100_000)
+def token_set(text: str) -> frozenset[str]:
+    return frozenset(
         t
         for t in normalize_name(text).split()
         if len(t) >= 3 and t not in STOPWORDS and not t.isdigit()
-    }
-    return tokens
+    )
 
 
-def similarity(a: str, b: str) -> float:
-    a_norm = normalize_name(a)
-    b_norm = normalize_name(b)
+def token_bitmap(tokens: frozenset[str]) -> int:
+    bits = 0
+    for token in tokens:
+        token_id = TOKEN_IDS.get(token)
+        if token_id is None:
+            token_id = TOKEN_IDS[token] = len(TOKEN_IDS)
+        bits |= 1 << token_id
+    return bits
+
+
+def prepare_name(text: str) -> PreparedName:
+    tokens = token_set(text)
+    return PreparedName(norm=normalize_name(text), tokens=tokens, token_bits=token_bitmap(tokens))
+
+
+def similarity_prepared(
+    a: PreparedName,
+    b: PreparedName,
+    matcher: SequenceMatcher | None = None,
+    floor: float = 0.0,
+) -> float:
+    """Score a against b; returns 0.0 early once the score cannot reach floor."""
+    a_norm = a.norm
+    b_norm = b.norm
     if not a_norm or not b_norm:
         return 0.0
 
-    seq = SequenceMatcher(None, a_norm, b_norm).ratio()
-    a_tokens = token_set(a)
-    b_tokens = token_set(b)
-    if not a_tokens or not b_tokens:
+    a_bits = a.token_bits
+    b_bits = b.token_bits
+    if not a_bits or not b_bits:
         jaccard = 0.0
     else:
-        jaccard = len(a_tokens & b_tokens) / len(a_tokens | b_tokens)
+        jaccard = (a_bits & b_bits).bit_count() / (a_bits | b_bits).bit_count()
+
+    # Even a perfect sequence ratio plus the boost cannot lift this pair to floor.
+    if floor > 0.0 and 0.65 + ((jaccard * 0.35) + 0.1) < floor:
+        return 0.0
 
     contains_boost = 0.1 if (a_norm in b_norm or b_norm in a_norm) else 0.0
-    score = (seq * 0.65) + (jaccard * 0.35) + contains_boost
+    fixed = (jaccard * 0.35) + contains_boost
+
+    if matcher is None:
+        matcher = SequenceMatcher(None, a_norm, b_norm)
+    else:
+        matcher.set_seq1(a_norm)
+    # real_quick_ratio() >= quick_ratio() >= ratio(), so try the cheap bounds first.
+    if floor > 0.0 and (
+        (matcher.real_quick_ratio() * 0.65) + fixed < floor
+        or (matcher.quick_ratio() * 0.65) + fixed < floor
+    ):
+        return 0.0
+    score = (matcher.ratio() * 0.65) + fixed
     return min(score, 1.0)
 
 
 def norad_get_json(path: str, params: dict[str, Any], key: str) -> Any:
     url = f"{NORAD_BASE}{path}"
-    response = requests.get(
+    response = SESSION.get(
         url,
         params=params,
         headers={"x-functions-key": key},
@@ -181,25 +294,37 @@ def norad_get_json(path: str, params: dict[str, Any], key: str) -> Any:
 
 
 def oecd_get_xml(url: str) -> ET.Element:
-    response = requests.get(url, timeout=90)
+    response = SESSION.get(url, timeout=90)
     response.raise_for_status()
     if response.text.startswith("NoRecordsFound") or response.text.startswith("NoResultsFound"):
         return ET.Element("empty")
     return ET.fromstring(response.text)
 
 
+def fetch_concurrently(fetch: Callable[[Any], Any], items: list[Any], workers: int) -> list[Any]:
+    """Apply fetch to items on a thread pool, keeping input order."""
+    if workers <= 1 or len(items) <= 1:
+        return [fetch(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(fetch, items))
+
+
 def fetch_organizations(conn: psycopg.Connection) -> list[Organization]:
-    rows = conn.execute(
-        """
-        SELECT id, canonical_name, hq_country
-        FROM organization
-        ORDER BY canonical_name
-        """
-    ).fetchall()
-    return [
-        Organization(id=int(r["id"]), name=str(r["canonical_name"]), hq_country=r["hq_country"])
-        for r in rows
-    ]
+    # Named (server-side) cursor: rows stream in batches instead of the whole
+    # result set being buffered client-side; tuple rows skip a dict per row.
+    with conn.cursor(name="enrich_organizations", row_factory=tuple_row) as cur:
+        cur.itersize = 10_000
+        cur.execute(
+            """
+            SELECT id, canonical_name, hq_country
+            FROM organization
+            ORDER BY canonical_name
+            """
+        )
+        return [
+            Organization(id=int(org_id), name=str(name), hq_country=hq_country)
+            for org_id, name, hq_country in cur
+        ]
 
 
 def fetch_norad_partners(key: str) -> list[NoradPartner]:
@@ -215,8 +340,18 @@ def fetch_norad_partners(key: str) -> list[NoradPartner]:
     return partners
 
 
-def best_norad_match(org_name: str, partners: list[NoradPartner]) -> MatchResult | None:
-    best: MatchResult | None = None
+def make_candidate(code: str, name: str, aliases: list[str]) -> MatchCandidate:
+    names = [prepare_name(alias) for alias in aliases]
+    return MatchCandidate(
+        code=code,
+        name=name,
+        names=names,
+        matchers=[SequenceMatcher(None, "", n.norm) for n in names],
+    )
+
+
+def build_norad_candidates(partners: list[NoradPartner]) -> list[MatchCandidate]:
+    candidates: list[MatchCandidate] = []
     for partner in partners:
         candidate_names = [partner.english, partner.norwegian]
         # Many entries start with acronym prefix: "ABC - Long Name".
@@ -224,120 +359,160 @@ def best_norad_match(org_name: str, partners: list[NoradPartner]) -> MatchResult
             candidate_names.append(partner.english.split(" - ", maxsplit=1)[1])
         if " - " in partner.norwegian:
             candidate_names.append(partner.norwegian.split(" - ", maxsplit=1)[1])
+        candidates.append(
+            make_candidate(str(partner.code), partner.english, [c for c in candidate_names if c])
+        )
+    return candidates
+
 
-        score = max(similarity(org_name, c) for c in candidate_names if c)
-        if best is None or score > best.score:
-            best = MatchResult(score=score, code=str(partner.code), name=partner.english)
+def build_match_index(candidates: list[MatchCandidate]) -> MatchIndex:
+    by_token: dict[str, list[int]] = {}
+    for idx, candidate in enumerate(candidates):
+        for token in frozenset().union(*(name.tokens for name in candidate.names)):
+            by_token.setdefault(token, []).append(idx)
+    return MatchIndex(candidates=candidates, by_token=by_token)
+
+
+def score_candidate(org: PreparedName, candidate: MatchCandidate, floor: float) -> float:
+    best = 0.0
+    for name, matcher in zip(candidate.names, candidate.matchers, strict=True):
+        score = similarity_prepared(org, name, matcher, max(floor, best))
+        if score > best:
+            best = score
     return best
 
 
-def ensure_source_document(
+def best_match(org_name: str, index: MatchIndex, threshold: float) -> MatchResult | None:
+    """Return the highest-scoring candidate at or above threshold.
+
+    Candidates sharing no token with the organization have zero Jaccard
+    overlap, so they cannot score above MAX_SCORE_WITHOUT_SHARED_TOKEN and
+    are only scored when that bound could still matter. Ties go to the
+    earliest candidate, as in a plain linear scan.
+    """
+    org = prepare_name(org_name)
+    by_token = index.by_token
+    shared: set[int] = set().union(*(by_token[t] for t in org.tokens if t in by_token))
+
+    best_idx = -1
+    best_score = 0.0
+    for idx in sorted(shared):
+        floor = threshold if best_idx < 0 else max(threshold, best_score)
+        score = score_candidate(org, index.candidates[idx], floor)
+        if best_idx < 0 or score > best_score:
+            best_idx, best_score = idx, score
+
+    if threshold <= MAX_SCORE_WITHOUT_SHARED_TOKEN and (
+        best_idx < 0 or best_score <= MAX_SCORE_WITHOUT_SHARED_TOKEN
+    ):
+        for idx, candidate in enumerate(index.candidates):
+            if idx in shared:
+                continue
+            floor = threshold if best_idx < 0 else max(threshold, best_score)
+            score = score_candidate(org, candidate, floor)
+            if best_idx < 0 or score > best_score or (score == best_score and idx < best_idx):
+                best_idx, best_score = idx, score
+
+    if best_idx < 0 or best_score < threshold:
+        return None
+    candidate = index.candidates[best_idx]
+    return MatchResult(score=best_score, code=candidate.code, name=candidate.name)
+
+
+def ensure_source_documents(
     conn: psycopg.Connection,
     *,
     source_name: str,
-    url: str,
     doc_type: str,
-    notes: str | None = None,
-) -> int:
-    row = conn.execute(
+    notes_by_url: dict[str, str],
+) -> dict[str, int]:
+    """Upsert one source_document per URL in a single statement; returns url -> id."""
+    if not notes_by_url:
+        return {}
+    rows = conn.execute(
         """
         INSERT INTO source_document (source_name, url, doc_type, notes)
-        VALUES (%s, %s, %s, %s)
+        SELECT %s, d.url, %s, d.notes
+        FROM unnest(%s::text[], %s::text[]) AS d(url, notes)
         ON CONFLICT (url)
         DO UPDATE SET
           source_name = COALESCE(EXCLUDED.source_name, source_document.source_name),
           doc_type = COALESCE(EXCLUDED.doc_type, source_document.doc_type),
           notes = COALESCE(EXCLUDED.notes, source_document.notes)
-        RETURNING id
+        RETURNING id, url
         """,
-        (source_name, url, doc_type, notes),
-    ).fetchone()
-    return int(row["id"])
+        (source_name, doc_type, list(notes_by_url), list(notes_by_url.values())),
+    ).fetchall()
+    return {r["url"]: int(r["id"]) for r in rows}
 
 
-def find_existing_funding_flow(
-    conn: psycopg.Connection,
-    *,
-    recipient_organization_id: int,
-    fiscal_year: int | None,
-    funding_channel: str,
-    amount_nok: float | None,
-    amount_original: float | None,
-    currency_code: str | None,
-) -> int | None:
-    row = conn.execute(
-        """
-        SELECT id
-        FROM funding_flow
-        WHERE donor_country_code = 'NO'
-          AND recipient_organization_id = %s
-          AND fiscal_year IS NOT DISTINCT FROM %s
-          AND funding_channel = %s
-          AND amount_nok IS NOT DISTINCT FROM %s
-          AND amount_original IS NOT DISTINCT FROM %s
-          AND currency_code IS NOT DISTINCT FROM %s
-        LIMIT 1
-        """,
-        (
-            recipient_organization_id,
-            fiscal_year,
-            funding_channel,
-            amount_nok,
-            amount_original,
-            currency_code,
-        ),
-    ).fetchone()
-    return int(row["id"]) if row else None
+def write_enriched_flows(conn: psycopg.Connection, flows: list[EnrichedFlow]) -> None:
+    """Bulk-upsert enrichment flows and their source links.
 
+    Rows are streamed into a temp table with COPY, then merged into funding_flow
+    (keyed by uq_funding_flow_enrichment) and linked to their source documents in
+    one set-based statement.
+    """
+    if not flows:
+        return
 
-def upsert_funding_flow(
-    conn: psycopg.Connection,
-    *,
-    recipient_organization_id: int,
-    fiscal_year: int | None,
-    funding_channel: str,
-    amount_nok: float | None,
-    amount_original: float | None,
-    currency_code: str | None,
-    notes: str | None,
-) -> int:
-    existing_id = find_existing_funding_flow(
-        conn,
-        recipient_organization_id=recipient_organization_id,
-        fiscal_year=fiscal_year,
-        funding_channel=funding_channel,
-        amount_nok=amount_nok,
-        amount_original=amount_original,
-        currency_code=currency_code,
+    conn.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS tmp_enriched_flow (
+          seq BIGINT NOT NULL,
+          recipient_organization_id BIGINT NOT NULL,
+          fiscal_year INT,
+          funding_channel TEXT NOT NULL,
+          amount_nok NUMERIC(20,2),
+          amount_original NUMERIC(20,2),
+          currency_code CHAR(3),
+          notes TEXT,
+          source_document_id BIGINT,
+          relation_type TEXT NOT NULL
+        ) ON COMMIT DROP
+        """
     )
-    if existing_id:
-        conn.execute(
+    conn.execute("TRUNCATE tmp_enriched_flow")
+
+    with conn.cursor() as cur:
+        with cur.copy(
             """
-            UPDATE funding_flow
-            SET notes = COALESCE(%s, notes)
-            WHERE id = %s
-            """,
-            (notes, existing_id),
-        )
-        return existing_id
+            COPY tmp_enriched_flow (
+              seq,
+              recipient_organization_id,
+              fiscal_year,
+              funding_channel,
+              amount_nok,
+              amount_original,
+              currency_code,
+              notes,
+              source_document_id,
+              relation_type
+            ) FROM STDIN
+            """
+        ) as copy:
+            for seq, flow in enumerate(flows):
+                copy.write_row(
+                    (
+                        seq,
+                        flow.recipient_organization_id,
+                        flow.fiscal_year,
+                        flow.funding_channel,
+                        flow.amount_nok,
+                        flow.amount_original,
+                        flow.currency_code,
+                        flow.notes,
+                        flow.source_document_id,
+                        flow.relation_type,
+                    )
+                )
 
-    row = conn.execute(
+    # DISTINCT ON keeps the last staged row per key, matching sequential upserts.
+    conn.execute(
         """
-        INSERT INTO funding_flow (
-          donor_country_code,
-          recipient_organization_id,
-          funding_channel,
-          amount_nok,
-          amount_original,
-          currency_code,
-          fiscal_year,
-          notes,
-          confidence
-        )
-        VALUES ('NO', %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id
-        """,
-        (
+        WITH upserted AS (
+          INSERT INTO funding_flow (
+            donor_country_code,
             recipient_organization_id,
             funding_channel,
             amount_nok,
@@ -345,26 +520,72 @@ def upsert_funding_flow(
             currency_code,
             fiscal_year,
             notes,
-            0.85,
-        ),
-    ).fetchone()
-    return int(row["id"])
-
-
-def ensure_funding_source_link(
-    conn: psycopg.Connection,
-    *,
-    funding_flow_id: int,
-    source_document_id: int,
-    relation_type: str,
-) -> None:
-    conn.execute(
-        """
-        INSERT INTO funding_flow_source_document (funding_flow_id, source_document_id, relation_type)
-        VALUES (%s, %s, %s)
+            confidence
+          )
+          SELECT DISTINCT ON (
+              recipient_organization_id,
+              fiscal_year,
+              funding_channel,
+              amount_nok,
+              amount_original,
+              currency_code
+            )
+            'NO',
+            recipient_organization_id,
+            funding_channel,
+            amount_nok,
+            amount_original,
+            currency_code,
+            fiscal_year,
+            notes,
+            0.85
+          FROM tmp_enriched_flow
+          ORDER BY
+            recipient_organization_id,
+            fiscal_year,
+            funding_channel,
+            amount_nok,
+            amount_original,
+            currency_code,
+            seq DESC
+          ON CONFLICT (
+            recipient_organization_id,
+            fiscal_year,
+            funding_channel,
+            amount_nok,
+            amount_original,
+            currency_code
+          )
+          WHERE donor_country_code = 'NO'
+            AND (
+              funding_channel LIKE 'NORAD partner_sid=%'
+              OR funding_channel = 'OECD DAC2A recipient proxy'
+            )
+          DO UPDATE SET notes = COALESCE(EXCLUDED.notes, funding_flow.notes)
+          RETURNING
+            id,
+            recipient_organization_id,
+            fiscal_year,
+            funding_channel,
+            amount_nok,
+            amount_original,
+            currency_code
+        )
+        INSERT INTO funding_flow_source_document (
+          funding_flow_id, source_document_id, relation_type
+        )
+        SELECT DISTINCT u.id, t.source_document_id, t.relation_type
+        FROM upserted u
+        JOIN tmp_enriched_flow t
+          ON t.recipient_organization_id = u.recipient_organization_id
+         AND t.fiscal_year IS NOT DISTINCT FROM u.fiscal_year
+         AND t.funding_channel = u.funding_channel
+         AND t.amount_nok IS NOT DISTINCT FROM u.amount_nok
+         AND t.amount_original IS NOT DISTINCT FROM u.amount_original
+         AND t.currency_code IS NOT DISTINCT FROM u.currency_code
+        WHERE t.source_document_id IS NOT NULL
         ON CONFLICT DO NOTHING
-        """,
-        (funding_flow_id, source_document_id, relation_type),
+        """
     )
 
 
@@ -403,25 +624,24 @@ def fetch_oecd_area_org_names() -> dict[str, str]:
     return result
 
 
-def best_oecd_match(
-    org_name: str,
+def build_oecd_candidates(
     recipient_codes: set[str],
     area_org_names: dict[str, str],
-) -> MatchResult | None:
-    best: MatchResult | None = None
-    for code, name in area_org_names.items():
-        if code not in recipient_codes:
-            continue
-        score = similarity(org_name, name)
-        if best is None or score > best.score:
-            best = MatchResult(score=score, code=code, name=name)
-    return best
+) -> list[MatchCandidate]:
+    return [
+        make_candidate(code, name, [name])
+        for code, name in area_org_names.items()
+        if code in recipient_codes
+    ]
 
 
 def hq_country_to_iso3(hq_country: str | None) -> str | None:
     if not hq_country:
         return None
     text = normalize_name(hq_country)
+    if not COUNTRY_HINT_RE.search(text):
+        return None
+    # First hint in dict order wins, not the leftmost occurrence in text.
     for hint, iso3 in COUNTRY_HINT_TO_ISO3.items():
         if hint in text:
             return iso3
@@ -470,14 +690,18 @@ def enrich_with_norad(
     end_year: int,
     threshold: float,
     dry_run: bool,
+    http_workers: int,
 ) -> dict[str, int]:
-    partners = fetch_norad_partners(key)
+    index = build_match_index(build_norad_candidates(fetch_norad_partners(key)))
 
     counts = {"matches": 0, "funding_rows": 0, "source_links": 0}
+    flows: list[EnrichedFlow] = []
 
+    matched: list[tuple[Organization, MatchResult, str]] = []
+    params_by_url: dict[str, dict[str, Any]] = {}
     for org in organizations:
-        match = best_norad_match(org.name, partners)
-        if match is None or match.score < threshold:
+        match = best_match(org.name, index, threshold)
+        if match is None:
             continue
 
         counts["matches"] += 1
@@ -489,21 +713,39 @@ def enrich_with_norad(
             "to_year": end_year,
         }
         url = f"{NORAD_BASE}/money?{urlencode(query_params)}"
-        payload = norad_get_json("/money", query_params, key)
-        if not isinstance(payload, list):
-            continue
+        params_by_url[url] = query_params
+        matched.append((org, match, url))
+
+    # Fetch all money payloads up front; database writes below stay serial.
+    # Organizations matched to the same partner share a request, fetched once.
+    payload_by_url = dict(
+        zip(
+            params_by_url,
+            fetch_concurrently(
+                lambda query_params: norad_get_json("/money", query_params, key),
+                list(params_by_url.values()),
+                http_workers,
+            ),
+            strict=True,
+        )
+    )
+    matched = [item for item in matched if isinstance(payload_by_url[item[2]], list)]
 
-        source_id = None
-        if not dry_run:
-            source_id = ensure_source_document(
-                conn,
-                source_name="norad-resultatportal-api",
-                url=url,
-                doc_type="api",
-                notes=f"agreement_partner_sid={match.code}; matched_name={match.name}",
-            )
+    source_ids: dict[str, int] = {}
+    if not dry_run:
+        source_ids = ensure_source_documents(
+            conn,
+            source_name="norad-resultatportal-api",
+            doc_type="api",
+            notes_by_url={
+                url: f"agreement_partner_sid={match.code}; matched_name={match.name}"
+                for _, match, url in matched
+            },
+        )
 
-        for row in payload:
+    for org, match, url in matched:
+        source_id = source_ids.get(url)
+        for row in payload_by_url[url]:
             year = row.get("data_year")
             amount = row.get("disbursement_earmarked_nok")
             if year is None or amount is None:
@@ -514,35 +756,27 @@ def enrich_with_norad(
             if amount_nok <= 0:
                 continue
 
-            funding_channel = f"NORAD partner_sid={match.code}"
-            notes = (
-                f"Norad match '{org.name}' -> '{match.name}' "
-                f"(score={match.score:.3f})"
-            )
-            if dry_run:
-                counts["funding_rows"] += 1
-                continue
-
-            flow_id = upsert_funding_flow(
-                conn,
-                recipient_organization_id=org.id,
-                fiscal_year=fiscal_year,
-                funding_channel=funding_channel,
-                amount_nok=amount_nok,
-                amount_original=None,
-                currency_code=None,
-                notes=notes,
-            )
-            counts["funding_rows"] += 1
-
-            if source_id is not None:
-                ensure_funding_source_link(
-                    conn,
-                    funding_flow_id=flow_id,
+            flows.append(
+                EnrichedFlow(
+                    recipient_organization_id=org.id,
+                    fiscal_year=fiscal_year,
+                    funding_channel=f"NORAD partner_sid={match.code}",
+                    amount_nok=amount_nok,
+                    amount_original=None,
+                    currency_code=None,
+                    notes=(
+                        f"Norad match '{org.name}' -> '{match.name}' "
+                        f"(score={match.score:.3f})"
+                    ),
                     source_document_id=source_id,
                     relation_type="norad_api",
                 )
-                counts["source_links"] += 1
+            )
+
+    counts["funding_rows"] = len(flows)
+    if not dry_run:
+        write_enriched_flows(conn, flows)
+        counts["source_links"] = sum(1 for flow in flows if flow.source_document_id is not None)
 
     return counts
 
@@ -554,24 +788,33 @@ def enrich_with_oecd(
     end_year: int,
     threshold: float,
     dry_run: bool,
+    http_workers: int,
 ) -> dict[str, int]:
     recipient_codes = fetch_oecd_recipient_codes()
     area_org_names = fetch_oecd_area_org_names()
+    index = build_match_index(build_oecd_candidates(recipient_codes, area_org_names))
 
     counts = {"matches": 0, "funding_rows": 0, "source_links": 0}
+    flows: list[EnrichedFlow] = []
 
+    # HQ country strings repeat heavily; resolve each distinct one once.
+    iso3_by_hq = {
+        hq: hq_country_to_iso3(hq) for hq in {org.hq_country for org in organizations} if hq
+    }
+
+    matched: list[tuple[Organization, str, str, float, str]] = []
     for org in organizations:
-        match = best_oecd_match(org.name, recipient_codes, area_org_names)
+        match = best_match(org.name, index, threshold)
         used_code = None
         used_name = None
         used_score = 0.0
 
-        if match is not None and match.score >= threshold:
+        if match is not None:
             used_code = match.code
             used_name = match.name
             used_score = match.score
         else:
-            iso3 = hq_country_to_iso3(org.hq_country)
+            iso3 = iso3_by_hq.get(org.hq_country) if org.hq_country else None
             if iso3 and iso3 in recipient_codes:
                 used_code = iso3
                 used_name = area_org_names.get(iso3, iso3)
@@ -584,32 +827,37 @@ def enrich_with_oecd(
 
         key = f"NOR.{used_code}.206.USD.V"
         url = OECD_DAC2_DATA_TEMPLATE.format(key=key, start_year=start_year, end_year=end_year)
-        root = oecd_get_xml(url)
-        unit_mult, points = parse_oecd_obs_values(root)
-        if not points:
-            continue
+        matched.append((org, used_code, used_name, used_score, url))
 
-        source_id = None
-        if not dry_run:
-            source_id = ensure_source_document(
-                conn,
-                source_name="oecd-dac2a-api",
-                url=url,
-                doc_type="api",
-                notes=f"recipient={used_code}; matched={used_name}",
-            )
+    urls = list(dict.fromkeys(item[4] for item in matched))
+    series_by_url = {
+        url: parse_oecd_obs_values(root)
+        for url, root in zip(
+            urls, fetch_concurrently(oecd_get_xml, urls, http_workers), strict=True
+        )
+    }
+    matched = [item for item in matched if series_by_url[item[4]][1]]
 
-        for fiscal_year, amount_usd in points:
-            notes = (
-                f"OECD DAC2A proxy recipient={used_code} ({used_name}); "
-                f"unit_mult={unit_mult}; match_score={used_score:.3f}"
-            )
-            if dry_run:
-                counts["funding_rows"] += 1
-                continue
+    source_ids: dict[str, int] = {}
+    if not dry_run:
+        source_ids = ensure_source_documents(
+            conn,
+            source_name="oecd-dac2a-api",
+            doc_type="api",
+            notes_by_url={
+                url: f"recipient={used_code}; matched={used_name}"
+                for _, used_code, used_name, _, url in matched
+            },
+        )
 
-            flow_id = upsert_funding_flow(
-                conn,
+    for org, used_code, used_name, used_score, url in matched:
+        unit_mult, points = series_by_url[url]
+        notes = (
+            f"OECD DAC2A proxy recipient={used_code} ({used_name}); "
+            f"unit_mult={unit_mult}; match_score={used_score:.3f}"
+        )
+        flows.extend(
+            EnrichedFlow(
                 recipient_organization_id=org.id,
                 fiscal_year=fiscal_year,
                 funding_channel="OECD DAC2A recipient proxy",
@@ -617,17 +865,16 @@ def enrich_with_oecd(
                 amount_original=amount_usd,
                 currency_code="USD",
                 notes=notes,
+                source_document_id=source_ids.get(url),
+                relation_type="oecd_dac2a_api",
             )
-            counts["funding_rows"] += 1
+            for fiscal_year, amount_usd in points
+        )
 
-            if source_id is not None:
-                ensure_funding_source_link(
-                    conn,
-                    funding_flow_id=flow_id,
-                    source_document_id=source_id,
-                    relation_type="oecd_dac2a_api",
-                )
-                counts["source_links"] += 1
+    counts["funding_rows"] = len(flows)
+    if not dry_run:
+        write_enriched_flows(conn, flows)
+        counts["source_links"] = sum(1 for flow in flows if flow.source_document_id is not None)
 
     return counts
 
@@ -665,6 +912,7 @@ def main() -> int:
             end_year=end_year,
             threshold=args.norad_match_threshold,
             dry_run=args.dry_run,
+            http_workers=args.http_workers,
         )
 
         oecd_counts = enrich_with_oecd(
@@ -674,6 +922,7 @@ def main() -> int:
             end_year=end_year,
             threshold=args.oecd_match_threshold,
             dry_run=args.dry_run,
+            http_workers=args.http_workers,
         )
 
         if args.dry_run:
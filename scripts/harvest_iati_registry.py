@@ -6,11 +6,13 @@ import hashlib
 import json
 import os
 import sys
+import time
 import xml.etree.ElementTree as ET
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal, InvalidOperation
+from pathlib import Path
 from typing import Any
 
 import psycopg
@@ -20,6 +22,7 @@ from psycopg.types.json import Jsonb
 
 REGISTRY_BASE = "https://iatiregistry.org/api/3/action"
 REGISTRY_DATASET_URL = "https://iatiregistry.org/dataset"
+ORGANIZATION_LIST_CACHE_TTL_SECONDS = 24 * 60 * 60
 
 
 @dataclass(slots=True)
@@ -56,6 +59,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable automatic publisher discovery by publisher_country=NO.",
     )
+    parser.add_argument(
+        "--refresh-publisher-cache",
+        action="store_true",
+        help="Revalidate the cached registry organization_list even if it is fresh.",
+    )
     parser.add_argument(
         "--max-packages",
         type=int,
@@ -97,8 +105,12 @@ def clean_text(value: Any) -> str | None:
     return text or None
 
 
-def registry_get_json(path: str, params: dict[str, Any]) -> dict[str, Any]:
-    response = requests.get(f"{REGISTRY_BASE}/{path}", params=params, timeout=90)
+def intern_text(value: str | None) -> str | None:
+    # Refs, codes and currencies repeat across every transaction in a resource.
+    return sys.intern(value) if value else None
+
+
+def registry_payload(response: requests.Response, path: str) -> dict[str, Any]:
     response.raise_for_status()
     payload = response.json()
     if isinstance(payload, dict) and "detail" in payload:
@@ -108,10 +120,63 @@ def registry_get_json(path: str, params: dict[str, Any]) -> dict[str, Any]:
     return payload
 
 
-def discover_norwegian_publishers() -> list[str]:
-    payload = registry_get_json("organization_list", {"all_fields": "true"})
+def registry_get_json(path: str, params: dict[str, Any]) -> dict[str, Any]:
+    response = requests.get(f"{REGISTRY_BASE}/{path}", params=params, timeout=90)
+    return registry_payload(response, path)
+
+
+def organization_list_cache_path() -> Path:
+    cache_home = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "norconnect" / "organization_list.json"
+
+
+def load_organization_list(*, refresh: bool) -> list[dict[str, Any]]:
+    """Return registry organizations, served from a local cache revalidated by ETag."""
+    cache_path = organization_list_cache_path()
+    cached: dict[str, Any] | None = None
+    cache_age: float | None = None
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        cache_age = time.time() - cache_path.stat().st_mtime
+    except (OSError, ValueError):
+        cached = None
+
+    if (
+        cached is not None
+        and not refresh
+        and cache_age is not None
+        and cache_age < ORGANIZATION_LIST_CACHE_TTL_SECONDS
+    ):
+        return cached.get("result", [])
+
+    headers = {}
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    response = requests.get(
+        f"{REGISTRY_BASE}/organization_list",
+        params={"all_fields": "true"},
+        headers=headers,
+        timeout=90,
+    )
+    if response.status_code == 304 and cached is not None:
+        cache_path.touch()
+        return cached.get("result", [])
+
+    result = registry_payload(response, "organization_list").get("result", [])
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"etag": response.headers.get("ETag"), "result": result}),
+            encoding="utf-8",
+        )
+    except OSError as exc:
+        print(f"warn: could not write registry cache {cache_path}: {exc}")
+    return result
+
+
+def discover_norwegian_publishers(*, refresh_cache: bool = False) -> list[str]:
     out: set[str] = set()
-    for org in payload.get("result", []):
+    for org in load_organization_list(refresh=refresh_cache):
         publisher_country = (org.get("publisher_country") or "").upper()
         package_count = int(org.get("package_count") or 0)
         publisher_id = clean_text(org.get("publisher_iati_id"))
@@ -277,16 +342,33 @@ def parse_iso_date(value: str | None) -> date | None:
         return None
 
 
-def parse_decimal(value: str | None) -> Decimal | None:
+def is_plain_decimal_text(value: str) -> bool:
+    # True when str(Decimal(value)) == value, so the input text can be reused as-is.
+    digits = value[1:] if value.startswith("-") else value
+    int_part, dot, frac_part = digits.partition(".")
+    if not int_part.isascii() or not int_part.isdigit():
+        return False
+    if int_part[0] == "0":
+        return False
+    if dot:
+        return frac_part.isascii() and frac_part.isdigit()
+    return True
+
+
+def parse_decimal(value: str | None) -> tuple[Decimal, str] | None:
+    """Return the amount together with its canonical text form."""
     if value is None:
         return None
     value = value.strip()
     if not value:
         return None
     try:
-        return Decimal(value)
+        amount = Decimal(value)
     except InvalidOperation:
         return None
+    if is_plain_decimal_text(value):
+        return amount, value
+    return amount, str(amount)
 
 
 def normalize_currency(code: str | None) -> str | None:
@@ -296,21 +378,7 @@ def normalize_currency(code: str | None) -> str | None:
     text = text.upper()
     if len(text) != 3:
         return None
-    return text
-
-
-def pick_participating_org(
-    orgs: list[dict[str, str | None]],
-    *,
-    roles: set[str],
-) -> dict[str, str | None] | None:
-    for org in orgs:
-        role = (org.get("role") or "").strip()
-        if role not in roles:
-            continue
-        if org.get("ref") or org.get("name"):
-            return org
-    return None
+    return sys.intern(text)
 
 
 def make_event_key(parts: list[str | None]) -> str:
@@ -407,7 +475,11 @@ def extract_transactions(
 
     activity_title = narrative_text(first_child(activity, "title"))
     reporting_org = first_child(activity, "reporting-org")
-    reporting_org_ref = clean_text(reporting_org.attrib.get("ref")) if reporting_org is not None else None
+    reporting_org_ref = (
+        intern_text(clean_text(reporting_org.attrib.get("ref")))
+        if reporting_org is not None
+        else None
+    )
     reporting_org_name = narrative_text(reporting_org)
 
     recipient_country = first_child(activity, "recipient-country")
@@ -418,18 +490,26 @@ def extract_transactions(
             recipient_country_code = recipient_country_code.upper()
             if len(recipient_country_code) != 2:
                 recipient_country_code = None
+            else:
+                recipient_country_code = sys.intern(recipient_country_code)
 
     participating_orgs: list[dict[str, str | None]] = []
+    fallback_receiver: dict[str, str | None] | None = None
     for org in child_elements(activity, "participating-org"):
-        participating_orgs.append(
-            {
-                "role": clean_text(org.attrib.get("role")),
-                "ref": clean_text(org.attrib.get("ref")),
-                "name": narrative_text(org),
-            }
-        )
+        participating_org = {
+            "role": clean_text(org.attrib.get("role")),
+            "ref": clean_text(org.attrib.get("ref")),
+            "name": narrative_text(org),
+        }
+        participating_orgs.append(participating_org)
+        # First implementing org (role 4) with a ref or name is the receiver fallback.
+        if (
+            fallback_receiver is None
+            and participating_org["role"] == "4"
+            and (participating_org["ref"] or participating_org["name"])
+        ):
+            fallback_receiver = participating_org
 
-    fallback_receiver = pick_participating_org(participating_orgs, roles={"4"})
     default_currency = normalize_currency(activity.attrib.get("default-currency"))
     rows: list[dict[str, Any]] = []
 
@@ -437,7 +517,9 @@ def extract_transactions(
         transaction_ref = clean_text(transaction.attrib.get("ref"))
 
         tx_type = first_child(transaction, "transaction-type")
-        tx_type_code = clean_text(tx_type.attrib.get("code")) if tx_type is not None else None
+        tx_type_code = (
+            intern_text(clean_text(tx_type.attrib.get("code"))) if tx_type is not None else None
+        )
 
         tx_date_node = first_child(transaction, "transaction-date")
         tx_date = None
@@ -446,10 +528,13 @@ def extract_transactions(
 
         value_node = first_child(transaction, "value")
         value_amount = None
+        value_amount_text = None
         value_currency = default_currency
         value_date = tx_date
         if value_node is not None:
-            value_amount = parse_decimal(flattened_text(value_node))
+            parsed_amount = parse_decimal(flattened_text(value_node))
+            if parsed_amount is not None:
+                value_amount, value_amount_text = parsed_amount
             value_currency = normalize_currency(value_node.attrib.get("currency")) or default_currency
             value_date = parse_iso_date(value_node.attrib.get("value-date")) or value_date
 
@@ -457,7 +542,11 @@ def extract_transactions(
             continue
 
         receiver_node = first_child(transaction, "receiver-org")
-        receiver_org_ref = clean_text(receiver_node.attrib.get("ref")) if receiver_node is not None else None
+        receiver_org_ref = (
+            intern_text(clean_text(receiver_node.attrib.get("ref")))
+            if receiver_node is not None
+            else None
+        )
         receiver_org_name = narrative_text(receiver_node)
 
         receiver_from_participating_org = False
@@ -467,7 +556,11 @@ def extract_transactions(
             receiver_from_participating_org = True
 
         provider_node = first_child(transaction, "provider-org")
-        provider_org_ref = clean_text(provider_node.attrib.get("ref")) if provider_node is not None else None
+        provider_org_ref = (
+            intern_text(clean_text(provider_node.attrib.get("ref")))
+            if provider_node is not None
+            else None
+        )
         provider_org_name = narrative_text(provider_node)
         if not provider_org_ref and not provider_org_name:
             provider_org_ref = reporting_org_ref
@@ -481,7 +574,7 @@ def extract_transactions(
                 tx_type_code,
                 tx_date.isoformat() if tx_date else None,
                 value_date.isoformat() if value_date else None,
-                str(value_amount),
+                value_amount_text,
                 value_currency,
                 receiver_org_ref,
                 receiver_org_name,
@@ -503,7 +596,7 @@ def extract_transactions(
                 "type_code": tx_type_code,
                 "transaction_date": tx_date.isoformat() if tx_date else None,
                 "value_date": value_date.isoformat() if value_date else None,
-                "value_amount": str(value_amount),
+                "value_amount": value_amount_text,
                 "value_currency": value_currency,
                 "receiver_org_ref": receiver_org_ref,
                 "receiver_org_name": receiver_org_name,
@@ -555,8 +648,12 @@ def ingest_resource(
     response.raw.decode_content = True
 
     try:
-        for _, elem in ET.iterparse(response.raw, events=("end",)):
-            if local_name(elem.tag) != "iati-activity":
+        # Keep a handle on the root so finished activities can be detached from it;
+        # elem.clear() alone still leaves an empty child per activity on the root.
+        context = ET.iterparse(response.raw, events=("start", "end"))
+        _, root = next(context)
+        for event, elem in context:
+            if event != "end" or local_name(elem.tag) != "iati-activity":
                 continue
 
             activities_seen += 1
@@ -577,6 +674,8 @@ def ingest_resource(
                         max_transactions_remaining -= 1
 
             elem.clear()
+            if elem in root:
+                root.remove(elem)
 
             if max_activities is not None and activities_seen >= max_activities:
                 break
@@ -599,7 +698,9 @@ def main() -> int:
 
     publisher_ids: set[str] = {p.strip() for p in args.publisher_iati_id if p.strip()}
     if not args.no_discover_norwegian_publishers:
-        for discovered in discover_norwegian_publishers():
+        for discovered in discover_norwegian_publishers(
+            refresh_cache=args.refresh_publisher_cache
+        ):
             publisher_ids.add(discovered)
 
     organization_slugs = sorted({s.strip() for s in args.organization_slug if s.strip()})
@@ -2,23 +2,82 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import sys
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
+from queue import Empty, Queue
 from typing import Any
 
 import psycopg
 from dotenv import load_dotenv
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, namedtuple_row, scalar_row, tuple_row
+
+BATCH_SIZE = 1000
+COMMIT_EVERY_ROWS = 5000
+
+NAME_KEEP_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789æøå ")
+COUNTRY_PREFIX_RE = re.compile(r"^([A-Za-z]{2})-")
+# Staged columns drawn from a small vocabulary; interned so each distinct
+# value is held once instead of once per row.
+INTERNED_STAGING_COLUMNS = frozenset(
+    {
+        "package_name",
+        "publisher_iati_id",
+        "resource_url",
+        "transaction_type_code",
+        "value_currency",
+        "reporting_org_ref",
+        "reporting_org_name",
+    }
+)
+
+
+class NameCharTable(dict):
+    """str.translate table that lowercases, spells out "&" as " and ", and
+    maps every remaining char outside [a-z0-9æøå ] to a space, in one pass."""
+
+    def __missing__(self, code: int) -> str:
+        value = "".join(c if c in NAME_KEEP_CHARS else " " for c in chr(code).lower())
+        self[code] = value
+        return value
+
+
+NAME_CHAR_TABLE = NameCharTable({ord("&"): " and "})
 
 
 @dataclass(slots=True)
 class OrganizationLookup:
     by_name: dict[str, int]
     by_ref: dict[str, int]
+    # (org_ref, org_name) -> map_organization result; staged rows repeat pairs.
+    resolved: dict[tuple[str | None, str | None], tuple[int | None, str]] = field(
+        default_factory=dict
+    )
+
+
+@dataclass(slots=True)
+class FundingFlowRow:
+    event_key: str
+    source_document_id: int
+    donor_organization_id: int | None
+    donor_country_code: str | None
+    recipient_organization_id: int | None
+    recipient_name_raw: str | None
+    funding_channel: str
+    amount_nok: Decimal | None
+    amount_original: Decimal | None
+    currency_code: str | None
+    fiscal_year: int | None
+    period_start: date | None
+    period_end: date | None
+    confidence: float
+    notes: str | None
 
 
 def parse_args() -> argparse.Namespace:
@@ -35,6 +94,12 @@ def parse_args() -> argparse.Namespace:
         type=int,
         help="Optional cap on number of staged rows processed.",
     )
+    parser.add_argument(
+        "--since-id",
+        type=int,
+        default=0,
+        help="Only process staged rows with id greater than this (resume after a partial run).",
+    )
     parser.add_argument(
         "--source-system",
         default="iati_registry",
@@ -49,73 +114,86 @@ def parse_args() -> argparse.Namespace:
 
 
 def clean_text(value: Any) -> str | None:
+    # Fast path: staged text columns arrive as str, so skip the str() round-trip.
+    if type(value) is str:
+        return value.strip() or None
     if value is None:
         return None
     text = str(value).strip()
     return text or None
 
 
+@functools.lru_cache(maxsize=65_536)
 def normalize_name(value: str) -> str:
-    value = value.lower()
-    value = value.replace("&", " and ")
-    value = re.sub(r"[^a-z0-9æøå ]", " ", value)
-    value = re.sub(r"\s+", " ", value).strip()
-    return value
+    return " ".join(value.translate(NAME_CHAR_TABLE).split())
 
 
+@functools.lru_cache(maxsize=65_536)
 def normalize_ref(value: str) -> str:
-    value = value.upper().strip()
-    value = re.sub(r"\s+", "", value)
-    return value
+    return "".join(value.upper().split())
+
+
+def alias_keys(alias: str) -> tuple[str, str | None]:
+    """Return (name_key, ref_key) for an alias; ref_key is None unless it looks like a ref.
+
+    Uncached on purpose: aliases are loaded once and are mostly distinct, so
+    routing them through the lru caches would only evict row-level entries.
+    """
+    name_key = " ".join(alias.translate(NAME_CHAR_TABLE).split())
+    ref_key = "".join(alias.upper().split()) if "-" in alias else None
+    return name_key, ref_key
 
 
+@functools.lru_cache(maxsize=65_536)
 def ref_to_country_code(ref: str | None) -> str | None:
     if not ref:
         return None
-    match = re.match(r"^([A-Za-z]{2})-", ref.strip())
+    match = COUNTRY_PREFIX_RE.match(ref.strip())
     if not match:
         return None
     return match.group(1).upper()
 
 
-def choose_fiscal_date(transaction_date: date | None, value_date: date | None) -> date | None:
-    return transaction_date or value_date
+@functools.lru_cache(maxsize=1024)
+def normalize_currency(value: str | None) -> str | None:
+    currency = clean_text(value)
+    return currency.upper() if currency else None
 
 
 def load_organization_lookup(conn: psycopg.Connection) -> OrganizationLookup:
     by_name: dict[str, int] = {}
     by_ref: dict[str, int] = {}
 
-    org_rows = conn.execute("SELECT id, canonical_name FROM organization ORDER BY id").fetchall()
-    for row in org_rows:
-        org_id = int(row["id"])
-        name = clean_text(row["canonical_name"])
+    # Rows are consumed as (id, text) tuples while iterating, rather than
+    # materialized as a list of dicts, so only the two key dicts stay resident.
+    cur = conn.cursor(row_factory=tuple_row)
+    cur.execute("SELECT id, canonical_name FROM organization ORDER BY id")
+    for org_id, canonical_name in cur:
+        name = clean_text(canonical_name)
         if not name:
             continue
         key = normalize_name(name)
         if key and key not in by_name:
-            by_name[key] = org_id
+            by_name[key] = int(org_id)
 
-    alias_rows = conn.execute(
+    cur.execute(
         """
         SELECT organization_id, alias
         FROM organization_alias
         ORDER BY id
         """
-    ).fetchall()
-    for row in alias_rows:
-        org_id = int(row["organization_id"])
-        alias = clean_text(row["alias"])
+    )
+    for org_id, raw_alias in cur:
+        org_id = int(org_id)
+        alias = clean_text(raw_alias)
         if not alias:
             continue
-        name_key = normalize_name(alias)
+        name_key, ref_key = alias_keys(alias)
         if name_key and name_key not in by_name:
             by_name[name_key] = org_id
-
-        if "-" in alias:
-            ref_key = normalize_ref(alias)
-            if ref_key and ref_key not in by_ref:
-                by_ref[ref_key] = org_id
+        if ref_key and ref_key not in by_ref:
+            by_ref[ref_key] = org_id
+    cur.close()
 
     return OrganizationLookup(by_name=by_name, by_ref=by_ref)
 
@@ -125,6 +203,21 @@ def map_organization(
     *,
     org_ref: str | None,
     org_name: str | None,
+) -> tuple[int | None, str]:
+    pair = (org_ref, org_name)
+    result = lookup.resolved.get(pair)
+    if result is None:
+        result = lookup.resolved[pair] = resolve_organization(
+            lookup, org_ref=org_ref, org_name=org_name
+        )
+    return result
+
+
+def resolve_organization(
+    lookup: OrganizationLookup,
+    *,
+    org_ref: str | None,
+    org_name: str | None,
 ) -> tuple[int | None, str]:
     ref = clean_text(org_ref)
     if ref:
@@ -143,76 +236,52 @@ def map_organization(
     return None, "none"
 
 
-def ensure_source_document(
-    conn: psycopg.Connection,
-    *,
-    resource_url: str,
-    package_name: str | None,
-    publisher_iati_id: str | None,
-) -> int:
+def source_document_notes(package_name: str | None, publisher_iati_id: str | None) -> str | None:
     notes = []
     if package_name:
         notes.append(f"package={package_name}")
     if publisher_iati_id:
         notes.append(f"publisher_iati_id={publisher_iati_id}")
+    return "; ".join(notes) if notes else None
+
 
-    row = conn.execute(
+def ensure_source_documents(
+    conn: psycopg.Connection,
+    notes_by_url: dict[str, str | None],
+) -> dict[str, int]:
+    """Upsert one source_document per URL in a single statement; returns url -> id."""
+    if not notes_by_url:
+        return {}
+    cur = conn.cursor(row_factory=tuple_row)
+    cur.execute(
         """
         INSERT INTO source_document (source_name, url, doc_type, notes)
-        VALUES (%s, %s, %s, %s)
+        SELECT 'iati-registry', d.url, 'iati_xml', d.notes
+        FROM unnest(%s::text[], %s::text[]) AS d(url, notes)
         ON CONFLICT (url)
         DO UPDATE SET
           source_name = COALESCE(EXCLUDED.source_name, source_document.source_name),
           doc_type = COALESCE(EXCLUDED.doc_type, source_document.doc_type),
           notes = COALESCE(EXCLUDED.notes, source_document.notes)
-        RETURNING id
-        """,
-        (
-            "iati-registry",
-            resource_url,
-            "iati_xml",
-            "; ".join(notes) if notes else None,
-        ),
-    ).fetchone()
-    return int(row["id"])
-
-
-def ensure_org_alias(
-    conn: psycopg.Connection,
-    *,
-    organization_id: int,
-    alias: str | None,
-    source_document_id: int | None,
-) -> None:
-    alias = clean_text(alias)
-    if not alias:
-        return
-    conn.execute(
-        """
-        INSERT INTO organization_alias (organization_id, alias, source_system, source_document_id)
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT (organization_id, alias) DO NOTHING
+        RETURNING url, id
         """,
-        (organization_id, alias, "iati_ref", source_document_id),
+        (list(notes_by_url), list(notes_by_url.values())),
     )
+    return dict(cur)
 
 
-def lookup_flow_by_ingest_key(
-    conn: psycopg.Connection,
-    *,
-    source_system: str,
-    event_key: str,
-) -> int | None:
-    row = conn.execute(
+def load_existing_ingest_keys(conn: psycopg.Connection, source_system: str) -> set[str]:
+    # One text column per row: read it as a scalar instead of building a dict per key.
+    cur = conn.cursor(row_factory=scalar_row)
+    cur.execute(
         """
-        SELECT funding_flow_id
+        SELECT event_key
         FROM funding_flow_ingest_key
-        WHERE source_system = %s AND event_key = %s
-        LIMIT 1
+        WHERE source_system = %s
         """,
-        (source_system, event_key),
-    ).fetchone()
-    return int(row["funding_flow_id"]) if row else None
+        (source_system,),
+    )
+    return set(cur)
 
 
 def clamp_confidence(value: float) -> float:
@@ -238,46 +307,146 @@ def build_confidence(
     return clamp_confidence(score)
 
 
-def insert_funding_flow(
+# build_confidence() for every (recipient, donor, date, type) flag combination,
+# indexed by a 4-bit mask in that order.
+CONFIDENCE_BY_MASK = tuple(
+    build_confidence(
+        recipient_mapped=bool(mask & 8),
+        donor_mapped=bool(mask & 4),
+        has_date=bool(mask & 2),
+        has_type=bool(mask & 1),
+    )
+    for mask in range(16)
+)
+
+
+@functools.lru_cache(maxsize=256)
+def funding_channel_for(tx_type: str | None) -> str:
+    if tx_type:
+        return f"IATI transaction type {tx_type}"
+    return "IATI transaction"
+
+
+def write_normalized_batch(
     conn: psycopg.Connection,
     *,
-    donor_organization_id: int | None,
-    donor_country_code: str | None,
-    recipient_organization_id: int | None,
-    recipient_name_raw: str | None,
-    funding_channel: str,
-    amount_nok: Decimal | None,
-    amount_original: Decimal | None,
-    currency_code: str | None,
-    fiscal_year: int | None,
-    period_start: date | None,
-    period_end: date | None,
-    confidence: float,
-    notes: str | None,
-) -> int:
-    row = conn.execute(
+    source_system: str,
+    flows: list[FundingFlowRow],
+    aliases: list[tuple[int, str, int | None]],
+) -> None:
+    """Bulk-insert flows, ingest keys, source links and aliases.
+
+    Rows are streamed into temp tables with COPY. Each staged flow draws its
+    funding_flow id from the identity sequence as a column default, so every
+    target table is filled by one data-modifying CTE statement.
+    """
+    if not flows and not aliases:
+        return
+
+    conn.execute(
         """
-        INSERT INTO funding_flow (
-          donor_organization_id,
-          donor_country_code,
-          recipient_organization_id,
-          recipient_name_raw,
-          funding_channel,
-          amount_nok,
-          amount_original,
-          currency_code,
-          fiscal_year,
-          period_start,
-          period_end,
-          confidence,
-          notes
-        )
-        VALUES (
-          %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        RETURNING id
-        """,
-        (
+        CREATE TEMP TABLE IF NOT EXISTS tmp_iati_funding_flow (
+          funding_flow_id BIGINT NOT NULL
+            DEFAULT nextval(pg_get_serial_sequence('funding_flow', 'id')),
+          event_key TEXT NOT NULL,
+          source_document_id BIGINT NOT NULL,
+          donor_organization_id BIGINT,
+          donor_country_code CHAR(2),
+          recipient_organization_id BIGINT,
+          recipient_name_raw TEXT,
+          funding_channel TEXT,
+          amount_nok NUMERIC(20,2),
+          amount_original NUMERIC(20,2),
+          currency_code CHAR(3),
+          fiscal_year INT,
+          period_start DATE,
+          period_end DATE,
+          confidence NUMERIC(4,3) NOT NULL,
+          notes TEXT
+        ) ON COMMIT DROP
+        """
+    )
+    conn.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS tmp_iati_org_alias (
+          organization_id BIGINT NOT NULL,
+          alias TEXT NOT NULL,
+          source_document_id BIGINT
+        ) ON COMMIT DROP
+        """
+    )
+    conn.execute("TRUNCATE tmp_iati_funding_flow, tmp_iati_org_alias")
+
+    with conn.cursor() as cur:
+        with cur.copy(
+            """
+            COPY tmp_iati_funding_flow (
+              event_key,
+              source_document_id,
+              donor_organization_id,
+              donor_country_code,
+              recipient_organization_id,
+              recipient_name_raw,
+              funding_channel,
+              amount_nok,
+              amount_original,
+              currency_code,
+              fiscal_year,
+              period_start,
+              period_end,
+              confidence,
+              notes
+            ) FROM STDIN
+            """
+        ) as copy:
+            for flow in flows:
+                copy.write_row(
+                    (
+                        flow.event_key,
+                        flow.source_document_id,
+                        flow.donor_organization_id,
+                        flow.donor_country_code,
+                        flow.recipient_organization_id,
+                        flow.recipient_name_raw,
+                        flow.funding_channel,
+                        flow.amount_nok,
+                        flow.amount_original,
+                        flow.currency_code,
+                        flow.fiscal_year,
+                        flow.period_start,
+                        flow.period_end,
+                        flow.confidence,
+                        flow.notes,
+                    )
+                )
+        with cur.copy(
+            "COPY tmp_iati_org_alias (organization_id, alias, source_document_id) FROM STDIN"
+        ) as copy:
+            for alias in aliases:
+                copy.write_row(alias)
+
+    conn.execute(
+        """
+        WITH inserted_flow AS (
+          INSERT INTO funding_flow (
+            id,
+            donor_organization_id,
+            donor_country_code,
+            recipient_organization_id,
+            recipient_name_raw,
+            funding_channel,
+            amount_nok,
+            amount_original,
+            currency_code,
+            fiscal_year,
+            period_start,
+            period_end,
+            confidence,
+            notes
+          )
+          OVERRIDING SYSTEM VALUE
+          SELECT
+            funding_flow_id,
             donor_organization_id,
             donor_country_code,
             recipient_organization_id,
@@ -290,72 +459,304 @@ def insert_funding_flow(
             period_start,
             period_end,
             confidence,
-            notes,
+            notes
+          FROM tmp_iati_funding_flow
+          ORDER BY funding_flow_id
         ),
-    ).fetchone()
-    return int(row["id"])
+        ingest_key AS (
+          INSERT INTO funding_flow_ingest_key (source_system, event_key, funding_flow_id)
+          SELECT %s, event_key, funding_flow_id
+          FROM tmp_iati_funding_flow
+          ON CONFLICT (source_system, event_key)
+          DO UPDATE SET funding_flow_id = EXCLUDED.funding_flow_id
+        ),
+        source_link AS (
+          INSERT INTO funding_flow_source_document (
+            funding_flow_id, source_document_id, relation_type
+          )
+          SELECT funding_flow_id, source_document_id, 'iati_xml'
+          FROM tmp_iati_funding_flow
+          ON CONFLICT DO NOTHING
+        )
+        INSERT INTO organization_alias (organization_id, alias, source_system, source_document_id)
+        SELECT organization_id, alias, 'iati_ref', source_document_id
+        FROM tmp_iati_org_alias
+        ON CONFLICT (organization_id, alias) DO NOTHING
+        """,
+        (source_system,),
+    )
 
 
-def ensure_funding_ingest_key(
-    conn: psycopg.Connection,
-    *,
-    source_system: str,
-    event_key: str,
-    funding_flow_id: int,
-) -> None:
+def maybe_truncate_source_rows(conn: psycopg.Connection, source_system: str) -> None:
+    # One statement: the ingest keys are scanned once (PK prefix on
+    # source_system) and drive the link and flow deletes as set-based joins.
     conn.execute(
         """
-        INSERT INTO funding_flow_ingest_key (source_system, event_key, funding_flow_id)
-        VALUES (%s, %s, %s)
-        ON CONFLICT (source_system, event_key)
-        DO UPDATE SET funding_flow_id = EXCLUDED.funding_flow_id
+        WITH deleted_key AS (
+          DELETE FROM funding_flow_ingest_key
+          WHERE source_system = %s
+          RETURNING funding_flow_id
+        ),
+        deleted_link AS (
+          DELETE FROM funding_flow_source_document fs
+          USING deleted_key k
+          WHERE fs.funding_flow_id = k.funding_flow_id
+        )
+        DELETE FROM funding_flow f
+        USING deleted_key k
+        WHERE f.id = k.funding_flow_id
         """,
-        (source_system, event_key, funding_flow_id),
+        (source_system,),
     )
 
 
-def ensure_funding_source_link(
+def normalize_batch(
     conn: psycopg.Connection,
+    rows: list[Any],
     *,
-    funding_flow_id: int,
-    source_document_id: int,
+    lookup: OrganizationLookup,
+    source_doc_by_url: dict[str, int],
+    existing_keys: set[str],
+    seen_aliases: set[tuple[int, str]],
+    source_system: str,
+    counts: dict[str, int],
 ) -> None:
-    conn.execute(
-        """
-        INSERT INTO funding_flow_source_document (funding_flow_id, source_document_id, relation_type)
-        VALUES (%s, %s, %s)
-        ON CONFLICT DO NOTHING
-        """,
-        (funding_flow_id, source_document_id, "iati_xml"),
-    )
+    """Map a batch of staged rows and write it with a handful of round-trips."""
+    if not rows:
+        return
 
+    flows: list[FundingFlowRow] = []
+    aliases: list[tuple[int, str, int | None]] = []
+
+    # Upsert the batch's unseen resource URLs up front in one statement; the
+    # first row per URL supplies the notes, as it did when upserted inline.
+    new_docs: dict[str, str | None] = {}
+    for row in rows:
+        resource_url = str(row.resource_url)
+        if (
+            row.event_key not in existing_keys
+            and resource_url not in source_doc_by_url
+            and resource_url not in new_docs
+        ):
+            new_docs[resource_url] = source_document_notes(
+                row.package_name, row.publisher_iati_id
+            )
+    source_doc_by_url.update(ensure_source_documents(conn, new_docs))
 
-def maybe_truncate_source_rows(conn: psycopg.Connection, source_system: str) -> None:
-    conn.execute(
-        """
-        DELETE FROM funding_flow_source_document fs
-        USING funding_flow_ingest_key k
-        WHERE k.source_system = %s
-          AND k.funding_flow_id = fs.funding_flow_id
-        """,
-        (source_system,),
-    )
-    conn.execute(
-        """
-        DELETE FROM funding_flow f
-        USING funding_flow_ingest_key k
-        WHERE k.source_system = %s
-          AND k.funding_flow_id = f.id
-        """,
-        (source_system,),
-    )
-    conn.execute(
-        """
-        DELETE FROM funding_flow_ingest_key
-        WHERE source_system = %s
-        """,
-        (source_system,),
-    )
+    for row in rows:
+        if row.event_key in existing_keys:
+            counts["skipped_existing"] += 1
+            continue
+
+        source_document_id = source_doc_by_url[str(row.resource_url)]
+
+        recipient_org_id, recipient_match_mode = map_organization(
+            lookup,
+            org_ref=row.receiver_org_ref,
+            org_name=row.receiver_org_name,
+        )
+        recipient_name_raw = None
+        if recipient_org_id is None:
+            recipient_name_raw = clean_text(row.receiver_org_name)
+            if recipient_name_raw is None:
+                counts["skipped_no_recipient"] += 1
+                continue
+        else:
+            counts["recipient_mapped"] += 1
+            alias = clean_text(row.receiver_org_ref)
+            if alias and (recipient_org_id, alias) not in seen_aliases:
+                seen_aliases.add((recipient_org_id, alias))
+                aliases.append((recipient_org_id, alias, source_document_id))
+
+        donor_org_id, donor_match_mode = map_organization(
+            lookup,
+            org_ref=row.provider_org_ref or row.reporting_org_ref,
+            org_name=row.provider_org_name or row.reporting_org_name,
+        )
+        if donor_org_id is not None:
+            counts["donor_mapped"] += 1
+            alias = clean_text(row.provider_org_ref or row.reporting_org_ref)
+            if alias and (donor_org_id, alias) not in seen_aliases:
+                seen_aliases.add((donor_org_id, alias))
+                aliases.append((donor_org_id, alias, source_document_id))
+
+        donor_country_code = ref_to_country_code(
+            row.provider_org_ref or row.reporting_org_ref
+        )
+
+        # value_amount is NUMERIC(24, 4); psycopg already loads it as Decimal.
+        amount = row.value_amount
+        if amount is None:
+            continue
+
+        currency = normalize_currency(row.value_currency)
+        amount_nok: Decimal | None
+        amount_original: Decimal | None
+        currency_code: str | None
+        if currency == "NOK" or currency is None:
+            amount_nok = amount
+            amount_original = None
+            currency_code = None
+        else:
+            amount_nok = None
+            amount_original = amount
+            currency_code = currency
+
+        fiscal_date = row.fiscal_date
+        fiscal_year = row.fiscal_year
+
+        tx_type = clean_text(row.transaction_type_code)
+
+        notes = (
+            f"IATI activity={row.activity_iati_identifier}; "
+            f"match_recipient={recipient_match_mode}; "
+            f"match_donor={donor_match_mode}; "
+            f"event_key={row.event_key}"
+        )
+        confidence = CONFIDENCE_BY_MASK[
+            (recipient_org_id is not None) << 3
+            | (donor_org_id is not None) << 2
+            | (fiscal_date is not None) << 1
+            | (tx_type is not None)
+        ]
+
+        flows.append(
+            FundingFlowRow(
+                event_key=row.event_key,
+                source_document_id=source_document_id,
+                donor_organization_id=donor_org_id,
+                donor_country_code=donor_country_code,
+                recipient_organization_id=recipient_org_id,
+                recipient_name_raw=recipient_name_raw,
+                funding_channel=funding_channel_for(tx_type),
+                amount_nok=amount_nok,
+                amount_original=amount_original,
+                currency_code=currency_code,
+                fiscal_year=fiscal_year,
+                period_start=fiscal_date,
+                period_end=fiscal_date,
+                confidence=confidence,
+                notes=notes,
+            )
+        )
+
+    write_normalized_batch(conn, source_system=source_system, flows=flows, aliases=aliases)
+    existing_keys.update(flow.event_key for flow in flows)
+    counts["inserted"] += len(flows)
+
+
+def interned_namedtuple_row(cursor: psycopg.Cursor[Any]) -> Any:
+    """namedtuple_row factory that interns INTERNED_STAGING_COLUMNS values."""
+    make_row = namedtuple_row(cursor)
+    positions = [
+        i
+        for i, column in enumerate(cursor.description or ())
+        if column.name in INTERNED_STAGING_COLUMNS
+    ]
+    intern = sys.intern
+
+    def intern_row(values: Any) -> Any:
+        values = list(values)
+        for i in positions:
+            value = values[i]
+            if value is not None:
+                values[i] = intern(value)
+        return make_row(values)
+
+    return intern_row
+
+
+def iter_staged_batches(
+    dsn: str,
+    run_id: int,
+    *,
+    since_id: int,
+    max_rows: int | None,
+) -> Iterator[list[Any]]:
+    """Yield staged rows for run_id in BATCH_SIZE lists from a dedicated connection."""
+    with psycopg.connect(dsn) as read_conn:
+        # Named (server-side) cursor: staged rows stream in itersize chunks
+        # instead of the whole run being buffered client-side up front.
+        # namedtuple rows: one tuple per row with attribute access, no per-row dict.
+        with read_conn.cursor(
+            name="stg_iati_transaction_rows", row_factory=interned_namedtuple_row
+        ) as cur:
+            cur.itersize = 5000
+            cur.execute(
+                """
+                SELECT
+                  id,
+                  package_name,
+                  publisher_iati_id,
+                  resource_url,
+                  activity_iati_identifier,
+                  transaction_type_code,
+                  COALESCE(transaction_date, value_date) AS fiscal_date,
+                  EXTRACT(YEAR FROM COALESCE(transaction_date, value_date))::int AS fiscal_year,
+                  value_amount,
+                  value_currency,
+                  receiver_org_ref,
+                  receiver_org_name,
+                  provider_org_ref,
+                  provider_org_name,
+                  reporting_org_ref,
+                  reporting_org_name,
+                  event_key
+                FROM stg_iati_transaction
+                WHERE ingest_run_id = %s AND id > %s
+                ORDER BY id
+                LIMIT %s
+                """,
+                (run_id, since_id, max_rows),
+            )
+            while batch := cur.fetchmany(BATCH_SIZE):
+                yield batch
+
+
+def prefetch_in_thread(items: Iterator[Any], depth: int = 2) -> Iterator[Any]:
+    """Drive items on a worker thread, keeping up to depth results queued ahead.
+
+    If the consumer stops early (an exception or close()), the worker is told to
+    stop and items is closed on the worker thread, so generator cleanup such as
+    closing cursors and connections still runs.
+    """
+    queue: Queue[tuple[str, Any]] = Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if stop.is_set():
+                    break
+                queue.put(("item", item))
+        except BaseException as exc:  # re-raised in the consuming thread
+            queue.put(("error", exc))
+        else:
+            queue.put(("done", None))
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = queue.get()
+            if kind == "error":
+                raise value
+            if kind == "done":
+                break
+            yield value
+    finally:
+        stop.set()
+        # Keep draining so a producer blocked on a full queue can reach the check.
+        while thread.is_alive():
+            try:
+                queue.get(timeout=0.1)
+            except Empty:
+                pass
+        thread.join()
 
 
 def main() -> int:
@@ -369,6 +770,9 @@ def main() -> int:
 
     with psycopg.connect(dsn, row_factory=dict_row) as conn:
         conn.autocommit = False
+        # Each chunk commit would otherwise wait for a WAL flush. A crash can only
+        # lose the last chunks, and ingest keys make the rerun pick them up again.
+        conn.execute("SET synchronous_commit = off")
 
         run_id = args.run_id
         if run_id is None:
@@ -391,181 +795,62 @@ def main() -> int:
 
         lookup = load_organization_lookup(conn)
         source_doc_by_url: dict[str, int] = {}
-
-        staged_rows = conn.execute(
-            """
-            SELECT
-              id,
-              package_name,
-              publisher_iati_id,
-              resource_url,
-              activity_iati_identifier,
-              transaction_type_code,
-              transaction_date,
-              value_date,
-              value_amount,
-              value_currency,
-              receiver_org_ref,
-              receiver_org_name,
-              provider_org_ref,
-              provider_org_name,
-              reporting_org_ref,
-              reporting_org_name,
-              event_key
-            FROM stg_iati_transaction
-            WHERE ingest_run_id = %s
-            ORDER BY id
-            """,
-            (run_id,),
-        )
-
+        existing_keys = load_existing_ingest_keys(conn, args.source_system)
+        # Aliases already sent this run; repeats would only hit ON CONFLICT DO NOTHING.
+        seen_aliases: set[tuple[int, str]] = set()
+
+        counts = {
+            "inserted": 0,
+            "skipped_existing": 0,
+            "skipped_no_recipient": 0,
+            "recipient_mapped": 0,
+            "donor_mapped": 0,
+        }
         processed = 0
-        inserted = 0
-        skipped_no_recipient = 0
-        skipped_existing = 0
-        donor_mapped_count = 0
-        recipient_mapped_count = 0
-
-        for row in staged_rows:
-            if args.max_rows is not None and processed >= args.max_rows:
-                break
-            processed += 1
-
-            existing_flow_id = lookup_flow_by_ingest_key(
-                conn,
-                source_system=args.source_system,
-                event_key=row["event_key"],
-            )
-            if existing_flow_id is not None:
-                skipped_existing += 1
-                continue
-
-            resource_url = str(row["resource_url"])
-            source_document_id = source_doc_by_url.get(resource_url)
-            if source_document_id is None:
-                source_document_id = ensure_source_document(
-                    conn,
-                    resource_url=resource_url,
-                    package_name=row["package_name"],
-                    publisher_iati_id=row["publisher_iati_id"],
-                )
-                source_doc_by_url[resource_url] = source_document_id
-
-            recipient_org_id, recipient_match_mode = map_organization(
-                lookup,
-                org_ref=row["receiver_org_ref"],
-                org_name=row["receiver_org_name"],
-            )
-            recipient_name_raw = None
-            if recipient_org_id is None:
-                recipient_name_raw = clean_text(row["receiver_org_name"])
-                if recipient_name_raw is None:
-                    skipped_no_recipient += 1
-                    continue
-            else:
-                recipient_mapped_count += 1
-                ensure_org_alias(
-                    conn,
-                    organization_id=recipient_org_id,
-                    alias=row["receiver_org_ref"],
-                    source_document_id=source_document_id,
-                )
+        uncommitted = 0
+        last_committed_id = args.since_id
 
-            donor_org_id, donor_match_mode = map_organization(
-                lookup,
-                org_ref=row["provider_org_ref"] or row["reporting_org_ref"],
-                org_name=row["provider_org_name"] or row["reporting_org_name"],
-            )
-            if donor_org_id is not None:
-                donor_mapped_count += 1
-                ensure_org_alias(
+        # Staged rows are read on a second connection in a background thread,
+        # so fetching the next batch overlaps with writing the current one.
+        staged_batches = iter_staged_batches(
+            dsn, run_id, since_id=args.since_id, max_rows=args.max_rows
+        )
+        batches = prefetch_in_thread(staged_batches)
+        try:
+            for batch in batches:
+                processed += len(batch)
+                uncommitted += len(batch)
+                normalize_batch(
                     conn,
-                    organization_id=donor_org_id,
-                    alias=row["provider_org_ref"] or row["reporting_org_ref"],
-                    source_document_id=source_document_id,
+                    batch,
+                    lookup=lookup,
+                    source_doc_by_url=source_doc_by_url,
+                    existing_keys=existing_keys,
+                    seen_aliases=seen_aliases,
+                    source_system=args.source_system,
+                    counts=counts,
                 )
-
-            donor_country_code = ref_to_country_code(
-                row["provider_org_ref"] or row["reporting_org_ref"]
-            )
-
-            amount = row["value_amount"]
-            if amount is None:
-                continue
-            if not isinstance(amount, Decimal):
-                amount = Decimal(str(amount))
-
-            currency = clean_text(row["value_currency"])
-            currency = currency.upper() if currency else None
-            amount_nok: Decimal | None
-            amount_original: Decimal | None
-            currency_code: str | None
-            if currency == "NOK" or currency is None:
-                amount_nok = amount
-                amount_original = None
-                currency_code = None
-            else:
-                amount_nok = None
-                amount_original = amount
-                currency_code = currency
-
-            fiscal_date = choose_fiscal_date(row["transaction_date"], row["value_date"])
-            fiscal_year = fiscal_date.year if fiscal_date else None
-
-            tx_type = clean_text(row["transaction_type_code"])
-            funding_channel = "IATI transaction"
-            if tx_type:
-                funding_channel = f"IATI transaction type {tx_type}"
-
-            notes = (
-                f"IATI activity={row['activity_iati_identifier']}; "
-                f"match_recipient={recipient_match_mode}; "
-                f"match_donor={donor_match_mode}; "
-                f"event_key={row['event_key']}"
-            )
-            confidence = build_confidence(
-                recipient_mapped=recipient_org_id is not None,
-                donor_mapped=donor_org_id is not None,
-                has_date=fiscal_date is not None,
-                has_type=tx_type is not None,
-            )
-
-            funding_flow_id = insert_funding_flow(
-                conn,
-                donor_organization_id=donor_org_id,
-                donor_country_code=donor_country_code,
-                recipient_organization_id=recipient_org_id,
-                recipient_name_raw=recipient_name_raw,
-                funding_channel=funding_channel,
-                amount_nok=amount_nok,
-                amount_original=amount_original,
-                currency_code=currency_code,
-                fiscal_year=fiscal_year,
-                period_start=fiscal_date,
-                period_end=fiscal_date,
-                confidence=confidence,
-                notes=notes,
-            )
-            inserted += 1
-
-            ensure_funding_ingest_key(
-                conn,
-                source_system=args.source_system,
-                event_key=row["event_key"],
-                funding_flow_id=funding_flow_id,
-            )
-            ensure_funding_source_link(
-                conn,
-                funding_flow_id=funding_flow_id,
-                source_document_id=source_document_id,
-            )
+                # Commit in chunks so WAL and locks do not build up over a long run;
+                # ingest keys make a rerun from --since-id (or from scratch) idempotent.
+                if uncommitted >= COMMIT_EVERY_ROWS:
+                    conn.commit()
+                    uncommitted = 0
+                    last_committed_id = int(batch[-1].id)
+        finally:
+            # Stops the reader thread and closes its cursor and connection even
+            # when a batch fails part-way through the run.
+            batches.close()
 
         conn.commit()
+        if processed:
+            last_committed_id = int(batch[-1].id)
 
     print(
-        f"Normalized iati run_id={run_id} processed={processed} inserted={inserted} "
-        f"skipped_existing={skipped_existing} skipped_no_recipient={skipped_no_recipient} "
-        f"recipient_mapped={recipient_mapped_count} donor_mapped={donor_mapped_count}"
+        f"Normalized iati run_id={run_id} processed={processed} inserted={counts['inserted']} "
+        f"skipped_existing={counts['skipped_existing']} "
+        f"skipped_no_recipient={counts['skipped_no_recipient']} "
+        f"recipient_mapped={counts['recipient_mapped']} donor_mapped={counts['donor_mapped']} "
+        f"last_staged_id={last_committed_id}"
     )
     return 0
 
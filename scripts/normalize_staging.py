@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import sys
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from typing import Any
@@ -12,7 +14,27 @@ from urllib.parse import urlparse
 
 import psycopg
 from dotenv import load_dotenv
-from psycopg.rows import dict_row
+
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+class AmountCharTable(dict):
+    """str.translate table for amounts: keeps [0-9-], turns the decimal comma into
+    ".", and drops everything else (thousands dots, spaces, "NOK", ...)."""
+
+    def __missing__(self, code: int) -> str | None:
+        char = chr(code)
+        if char == ",":
+            value = "."
+        elif char == "-" or "0" <= char <= "9":
+            value = char
+        else:
+            value = None
+        self[code] = value
+        return value
+
+
+AMOUNT_CHAR_TABLE = AmountCharTable()
 
 
 def parse_args() -> argparse.Namespace:
@@ -51,7 +73,24 @@ def parse_date(value: Any) -> date | None:
     if not text:
         return None
 
-    if len(text) >= 10 and re.match(r"^\d{4}-\d{2}-\d{2}", text):
+    # Happy paths for YYYY-MM-DD[...] and DD.MM.YYYY: slice the digits straight
+    # into date() instead of going through the regex and strptime attempts.
+    # No other format can match these shapes, so a bad date is simply None.
+    if len(text) >= 10 and text.isascii():
+        if text[4] == "-" and text[7] == "-" and (text[:4] + text[5:7] + text[8:10]).isdigit():
+            try:
+                return date(int(text[:4]), int(text[5:7]), int(text[8:10]))
+            except ValueError:
+                return None
+        if len(text) == 10 and text[2] == "." and text[5] == "." and (
+            text[:2] + text[3:5] + text[6:]
+        ).isdigit():
+            try:
+                return date(int(text[6:]), int(text[3:5]), int(text[:2]))
+            except ValueError:
+                return None
+
+    if len(text) >= 10 and ISO_DATE_RE.match(text):
         try:
             return date.fromisoformat(text[:10])
         except ValueError:
@@ -78,13 +117,8 @@ def parse_amount_nok(value: Any) -> Decimal | None:
     if not text:
         return None
 
-    # Handle common text formats like "NOK 270 000 000".
-    text = text.replace("\u00a0", " ")
-    text = text.replace("NOK", "").replace("nok", "")
-    text = text.replace(" ", "")
-    text = text.replace(".", "")
-    text = text.replace(",", ".")
-    text = re.sub(r"[^0-9.\-]", "", text)
+    # Handle common text formats like "NOK 270 000 000" in a single pass.
+    text = text.translate(AMOUNT_CHAR_TABLE)
     if not text:
         return None
 
@@ -94,6 +128,7 @@ def parse_amount_nok(value: Any) -> Decimal | None:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def source_name_for_url(url: str) -> str | None:
     try:
         host = urlparse(url).netloc.lower()
@@ -104,159 +139,357 @@ def source_name_for_url(url: str) -> str | None:
     return host
 
 
-def ensure_person(conn: psycopg.Connection, canonical_name: str) -> int:
-    row = conn.execute(
-        """
-        INSERT INTO person (canonical_name)
-        VALUES (%s)
-        ON CONFLICT (canonical_name)
-        DO UPDATE SET canonical_name = EXCLUDED.canonical_name
-        RETURNING id
-        """,
-        (canonical_name,),
-    ).fetchone()
-    return int(row["id"])
+@dataclass(slots=True)
+class RoleRow:
+    person_name: str
+    org_name: str
+    org_type: str | None
+    hq_country: str | None
+    role_title: str
+    role_level: str | None
+    norwegian_position_before: str | None
+    announced_on: date | None
+    start_on: date | None
+    end_on: date | None
+    appointment_url: str | None
+    bio_url: str | None
+    has_funding: bool
+    donor_url: str | None
+    funding_channel: str | None
+    amount_nok: Decimal | None
+    fiscal_year: int | None
+    funding_notes: str | None
+
+
+def http_url(value: Any) -> str | None:
+    url = clean_text(value)
+    if url and url.startswith(("http://", "https://")):
+        return url
+    return None
 
 
-def ensure_organization(
-    conn: psycopg.Connection,
-    canonical_name: str,
-    org_type: str | None,
-    hq_country: str | None,
-) -> int:
-    row = conn.execute(
+def parse_role_row(payload: dict[str, Any]) -> RoleRow | None:
+    get = payload.get
+    org_name = clean_text(get("Organisasjon"))
+    person_name = clean_text(get("Norsk toppperson"))
+    role_title = clean_text(get("Rolle/tittel"))
+    if not org_name or not person_name or not role_title:
+        return None
+
+    announced_on = parse_date(get("Dato kunngjort/valgt"))
+    start_on = parse_date(get("Tiltredelse"))
+    amount_nok = parse_amount_nok(get("Dokumentert beløp (NOK)"))
+    funding_channel = clean_text(get("Bidragskanal (typisk)"))
+    raw_donor_url = clean_text(get("Primærkilde: bidrag/donoroversikt (URL)"))
+
+    return RoleRow(
+        person_name=person_name,
+        org_name=org_name,
+        org_type=clean_text(get("Type")),
+        hq_country=clean_text(get("Hovedsete/land")),
+        role_title=role_title,
+        role_level=clean_text(get("Nivå")),
+        norwegian_position_before=clean_text(get("Norsk posisjon før (kort)")),
+        announced_on=announced_on,
+        start_on=start_on,
+        end_on=parse_date(get("Slutt")),
+        appointment_url=http_url(get("Primærkilde: utnevnelse/valg (URL)")),
+        bio_url=http_url(get("Primærkilde: bio/rolle (URL)")),
+        has_funding=bool(amount_nok is not None or funding_channel or raw_donor_url),
+        donor_url=http_url(raw_donor_url),
+        funding_channel=funding_channel,
+        amount_nok=amount_nok,
+        fiscal_year=start_on.year if start_on else (announced_on.year if announced_on else None),
+        funding_notes=clean_text(get("Beløp – detaljer/forbehold")),
+    )
+
+
+def collect_source_documents(
+    datakilde_payloads: list[dict[str, Any]],
+    role_rows: list[RoleRow],
+) -> tuple[dict[str, tuple[str | None, str]], int]:
+    """Fold every source-document reference into its final (source_name, doc_type) per URL.
+
+    References are applied in the order the per-row upserts used to run, so a
+    later non-null source_name and the last doc_type win, as before. Also
+    returns the number of references folded.
+    """
+    docs: dict[str, tuple[str | None, str]] = {}
+    references = 0
+
+    def add(url: str, doc_type: str, source_name: str | None) -> None:
+        nonlocal references
+        references += 1
+        previous = docs.get(url)
+        if source_name is None and previous is not None:
+            source_name = previous[0]
+        docs[url] = (source_name, doc_type)
+
+    for payload in datakilde_payloads:
+        url = http_url(payload.get("URL"))
+        if url:
+            add(url, "catalog", clean_text(payload.get("Datakilde")) or source_name_for_url(url))
+
+    for role in role_rows:
+        if role.appointment_url:
+            add(role.appointment_url, "appointment", source_name_for_url(role.appointment_url))
+        if role.bio_url:
+            add(role.bio_url, "bio", source_name_for_url(role.bio_url))
+        if role.donor_url:
+            add(role.donor_url, "funding", source_name_for_url(role.donor_url))
+
+    return docs, references
+
+
+def load_staged_roles(conn: psycopg.Connection, role_rows: list[RoleRow]) -> None:
+    conn.execute(
         """
-        INSERT INTO organization (canonical_name, org_type, hq_country)
-        VALUES (%s, %s, %s)
-        ON CONFLICT (canonical_name)
-        DO UPDATE SET
-          org_type = COALESCE(EXCLUDED.org_type, organization.org_type),
-          hq_country = COALESCE(EXCLUDED.hq_country, organization.hq_country)
-        RETURNING id
-        """,
-        (canonical_name, org_type, hq_country),
-    ).fetchone()
-    return int(row["id"])
+        CREATE TEMP TABLE tmp_excel_role_row (
+          row_no INT NOT NULL,
+          person_name CITEXT NOT NULL,
+          org_name CITEXT NOT NULL,
+          org_type TEXT,
+          hq_country TEXT,
+          role_title TEXT NOT NULL,
+          role_level TEXT,
+          norwegian_position_before TEXT,
+          announced_on DATE,
+          start_on DATE,
+          end_on DATE,
+          appointment_url TEXT,
+          bio_url TEXT,
+          has_funding BOOLEAN NOT NULL,
+          donor_url TEXT,
+          funding_channel TEXT,
+          amount_nok NUMERIC(20,2),
+          fiscal_year INT,
+          funding_notes TEXT,
+          person_id BIGINT,
+          organization_id BIGINT,
+          role_event_id BIGINT,
+          funding_flow_id BIGINT
+        ) ON COMMIT DROP
+        """
+    )
+    with conn.cursor().copy(
+        """
+        COPY tmp_excel_role_row (
+          row_no, person_name, org_name, org_type, hq_country, role_title, role_level,
+          norwegian_position_before, announced_on, start_on, end_on, appointment_url,
+          bio_url, has_funding, donor_url, funding_channel, amount_nok, fiscal_year,
+          funding_notes
+        ) FROM STDIN
+        """
+    ) as copy:
+        for row_no, role in enumerate(role_rows):
+            copy.write_row(
+                (
+                    row_no,
+                    role.person_name,
+                    role.org_name,
+                    role.org_type,
+                    role.hq_country,
+                    role.role_title,
+                    role.role_level,
+                    role.norwegian_position_before,
+                    role.announced_on,
+                    role.start_on,
+                    role.end_on,
+                    role.appointment_url,
+                    role.bio_url,
+                    role.has_funding,
+                    role.donor_url,
+                    role.funding_channel,
+                    role.amount_nok,
+                    role.fiscal_year,
+                    role.funding_notes,
+                )
+            )
 
 
-def ensure_source_document(
+def upsert_source_documents(
     conn: psycopg.Connection,
-    url: str,
-    doc_type: str,
-    source_name: str | None = None,
-) -> int:
-    row = conn.execute(
+    docs: dict[str, tuple[str | None, str]],
+) -> None:
+    conn.execute(
+        """
+        CREATE TEMP TABLE tmp_excel_source (
+          ord INT NOT NULL,
+          url TEXT NOT NULL,
+          source_name TEXT,
+          doc_type TEXT NOT NULL
+        ) ON COMMIT DROP
+        """
+    )
+    with conn.cursor().copy(
+        "COPY tmp_excel_source (ord, url, source_name, doc_type) FROM STDIN"
+    ) as copy:
+        for position, (url, (source_name, doc_type)) in enumerate(docs.items()):
+            copy.write_row((position, url, source_name, doc_type))
+
+    conn.execute(
         """
         INSERT INTO source_document (source_name, url, doc_type)
-        VALUES (%s, %s, %s)
+        SELECT source_name, url, doc_type
+        FROM tmp_excel_source
+        ORDER BY ord
         ON CONFLICT (url)
         DO UPDATE SET
           source_name = COALESCE(EXCLUDED.source_name, source_document.source_name),
           doc_type = COALESCE(EXCLUDED.doc_type, source_document.doc_type)
-        RETURNING id
-        """,
-        (source_name, url, doc_type),
-    ).fetchone()
-    return int(row["id"])
+        """
+    )
 
 
-def ensure_role_event(
-    conn: psycopg.Connection,
-    person_id: int,
-    organization_id: int,
-    role_title: str,
-    role_level: str | None,
-    norwegian_position_before: str | None,
-    announced_on: date | None,
-    start_on: date | None,
-    end_on: date | None,
-) -> int:
-    existing = conn.execute(
+# Per-key column values end up as the last non-null value seen, matching the
+# COALESCE(new, current) updates that repeated rows used to apply one by one.
+ROLE_EVENT_MATCH_SQL = """
+    UPDATE tmp_excel_role_row t
+    SET role_event_id = (
+      SELECT r.id
+      FROM role_event r
+      WHERE r.person_id = t.person_id
+        AND r.organization_id = t.organization_id
+        AND r.role_title = t.role_title
+        AND r.start_on IS NOT DISTINCT FROM t.start_on
+      ORDER BY r.id
+      LIMIT 1
+    )
+    WHERE t.role_event_id IS NULL
+"""
+
+FUNDING_FLOW_MATCH_SQL = """
+    UPDATE tmp_excel_role_row t
+    SET funding_flow_id = (
+      SELECT f.id
+      FROM funding_flow f
+      WHERE f.donor_country_code = 'NO'
+        AND f.recipient_organization_id = t.organization_id
+        AND f.fiscal_year IS NOT DISTINCT FROM t.fiscal_year
+        AND f.funding_channel IS NOT DISTINCT FROM t.funding_channel
+        AND f.amount_nok IS NOT DISTINCT FROM t.amount_nok
+      ORDER BY f.id
+      LIMIT 1
+    )
+    WHERE t.has_funding AND t.funding_flow_id IS NULL
+"""
+
+
+def upsert_people_and_organizations(conn: psycopg.Connection) -> None:
+    conn.execute(
         """
-        SELECT id
-        FROM role_event
-        WHERE person_id = %s
-          AND organization_id = %s
-          AND role_title = %s
-          AND start_on IS NOT DISTINCT FROM %s
-        LIMIT 1
-        """,
-        (person_id, organization_id, role_title, start_on),
-    ).fetchone()
-
-    if existing:
-        role_event_id = int(existing["id"])
-        conn.execute(
-            """
-            UPDATE role_event
-            SET role_level = COALESCE(%s, role_level),
-                norwegian_position_before = COALESCE(%s, norwegian_position_before),
-                announced_on = COALESCE(%s, announced_on),
-                end_on = COALESCE(%s, end_on)
-            WHERE id = %s
-            """,
-            (role_level, norwegian_position_before, announced_on, end_on, role_event_id),
-        )
-        return role_event_id
+        INSERT INTO person (canonical_name)
+        SELECT (array_agg(person_name ORDER BY row_no DESC))[1]
+        FROM tmp_excel_role_row
+        GROUP BY person_name
+        ORDER BY min(row_no)
+        ON CONFLICT (canonical_name)
+        DO UPDATE SET canonical_name = EXCLUDED.canonical_name
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO organization (canonical_name, org_type, hq_country)
+        SELECT
+          (array_agg(org_name ORDER BY row_no))[1],
+          (array_agg(org_type ORDER BY row_no DESC) FILTER (WHERE org_type IS NOT NULL))[1],
+          (array_agg(hq_country ORDER BY row_no DESC) FILTER (WHERE hq_country IS NOT NULL))[1]
+        FROM tmp_excel_role_row
+        GROUP BY org_name
+        ORDER BY min(row_no)
+        ON CONFLICT (canonical_name)
+        DO UPDATE SET
+          org_type = COALESCE(EXCLUDED.org_type, organization.org_type),
+          hq_country = COALESCE(EXCLUDED.hq_country, organization.hq_country)
+        """
+    )
+    conn.execute(
+        """
+        UPDATE tmp_excel_role_row t
+        SET person_id = p.id, organization_id = o.id
+        FROM person p, organization o
+        WHERE p.canonical_name = t.person_name
+          AND o.canonical_name = t.org_name
+        """
+    )
+
 
-    row = conn.execute(
+def upsert_role_events(conn: psycopg.Connection) -> None:
+    conn.execute(ROLE_EVENT_MATCH_SQL)
+    conn.execute(
+        """
+        UPDATE role_event r
+        SET role_level = COALESCE(s.role_level, r.role_level),
+            norwegian_position_before = COALESCE(
+              s.norwegian_position_before, r.norwegian_position_before
+            ),
+            announced_on = COALESCE(s.announced_on, r.announced_on),
+            end_on = COALESCE(s.end_on, r.end_on)
+        FROM (
+          SELECT
+            role_event_id,
+            (array_agg(role_level ORDER BY row_no DESC)
+              FILTER (WHERE role_level IS NOT NULL))[1] AS role_level,
+            (array_agg(norwegian_position_before ORDER BY row_no DESC)
+              FILTER (WHERE norwegian_position_before IS NOT NULL))[1] AS norwegian_position_before,
+            (array_agg(announced_on ORDER BY row_no DESC)
+              FILTER (WHERE announced_on IS NOT NULL))[1] AS announced_on,
+            (array_agg(end_on ORDER BY row_no DESC)
+              FILTER (WHERE end_on IS NOT NULL))[1] AS end_on
+          FROM tmp_excel_role_row
+          WHERE role_event_id IS NOT NULL
+          GROUP BY role_event_id
+        ) s
+        WHERE r.id = s.role_event_id
+        """
+    )
+    conn.execute(
         """
         INSERT INTO role_event (
           person_id, organization_id, role_title, role_level,
           norwegian_position_before, announced_on, start_on, end_on
         )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id
-        """,
-        (
-            person_id,
-            organization_id,
-            role_title,
-            role_level,
-            norwegian_position_before,
-            announced_on,
-            start_on,
-            end_on,
-        ),
-    ).fetchone()
-    return int(row["id"])
-
-
-def ensure_funding_flow(
-    conn: psycopg.Connection,
-    recipient_organization_id: int,
-    funding_channel: str | None,
-    amount_nok: Decimal | None,
-    fiscal_year: int | None,
-    notes: str | None,
-) -> int:
-    existing = conn.execute(
+        SELECT
+          person_id,
+          organization_id,
+          role_title,
+          (array_agg(role_level ORDER BY row_no DESC)
+            FILTER (WHERE role_level IS NOT NULL))[1],
+          (array_agg(norwegian_position_before ORDER BY row_no DESC)
+            FILTER (WHERE norwegian_position_before IS NOT NULL))[1],
+          (array_agg(announced_on ORDER BY row_no DESC)
+            FILTER (WHERE announced_on IS NOT NULL))[1],
+          start_on,
+          (array_agg(end_on ORDER BY row_no DESC)
+            FILTER (WHERE end_on IS NOT NULL))[1]
+        FROM tmp_excel_role_row
+        WHERE role_event_id IS NULL
+        GROUP BY person_id, organization_id, role_title, start_on
+        ORDER BY min(row_no)
         """
-        SELECT id
-        FROM funding_flow
-        WHERE donor_country_code = 'NO'
-          AND recipient_organization_id = %s
-          AND fiscal_year IS NOT DISTINCT FROM %s
-          AND funding_channel IS NOT DISTINCT FROM %s
-          AND amount_nok IS NOT DISTINCT FROM %s
-        LIMIT 1
-        """,
-        (recipient_organization_id, fiscal_year, funding_channel, amount_nok),
-    ).fetchone()
-
-    if existing:
-        funding_flow_id = int(existing["id"])
-        conn.execute(
-            """
-            UPDATE funding_flow
-            SET notes = COALESCE(%s, notes)
-            WHERE id = %s
-            """,
-            (notes, funding_flow_id),
-        )
-        return funding_flow_id
+    )
+    conn.execute(ROLE_EVENT_MATCH_SQL)
+
 
-    row = conn.execute(
+def upsert_funding_flows(conn: psycopg.Connection) -> None:
+    conn.execute(FUNDING_FLOW_MATCH_SQL)
+    conn.execute(
+        """
+        UPDATE funding_flow f
+        SET notes = COALESCE(s.notes, f.notes)
+        FROM (
+          SELECT
+            funding_flow_id,
+            (array_agg(funding_notes ORDER BY row_no DESC)
+              FILTER (WHERE funding_notes IS NOT NULL))[1] AS notes
+          FROM tmp_excel_role_row
+          WHERE funding_flow_id IS NOT NULL
+          GROUP BY funding_flow_id
+        ) s
+        WHERE f.id = s.funding_flow_id
+        """
+    )
+    conn.execute(
         """
         INSERT INTO funding_flow (
           donor_country_code,
@@ -266,57 +499,79 @@ def ensure_funding_flow(
           fiscal_year,
           notes
         )
-        VALUES ('NO', %s, %s, %s, %s, %s)
-        RETURNING id
-        """,
-        (recipient_organization_id, funding_channel, amount_nok, fiscal_year, notes),
-    ).fetchone()
-    return int(row["id"])
-
-
-def ensure_junction(conn: psycopg.Connection, table: str, ids: tuple[Any, ...]) -> None:
-    if table == "role_event_source_document":
-        conn.execute(
-            """
-            INSERT INTO role_event_source_document (role_event_id, source_document_id, relation_type)
-            VALUES (%s, %s, %s)
-            ON CONFLICT DO NOTHING
-            """,
-            ids,
-        )
-        return
-    if table == "funding_flow_source_document":
-        conn.execute(
-            """
-            INSERT INTO funding_flow_source_document (funding_flow_id, source_document_id, relation_type)
-            VALUES (%s, %s, %s)
-            ON CONFLICT DO NOTHING
-            """,
-            ids,
-        )
-        return
-    if table == "person_source_document":
-        conn.execute(
-            """
-            INSERT INTO person_source_document (person_id, source_document_id, relation_type)
-            VALUES (%s, %s, %s)
-            ON CONFLICT DO NOTHING
-            """,
-            ids,
+        SELECT
+          'NO',
+          organization_id,
+          funding_channel,
+          amount_nok,
+          fiscal_year,
+          (array_agg(funding_notes ORDER BY row_no DESC)
+            FILTER (WHERE funding_notes IS NOT NULL))[1]
+        FROM tmp_excel_role_row
+        WHERE has_funding AND funding_flow_id IS NULL
+        GROUP BY organization_id, fiscal_year, funding_channel, amount_nok
+        ORDER BY min(row_no)
+        """
+    )
+    conn.execute(FUNDING_FLOW_MATCH_SQL)
+
+
+def insert_source_links(conn: psycopg.Connection) -> None:
+    conn.execute(
+        """
+        INSERT INTO role_event_source_document (role_event_id, source_document_id, relation_type)
+        SELECT t.role_event_id, s.id, 'appointment'
+        FROM tmp_excel_role_row t
+        JOIN source_document s ON s.url = t.appointment_url
+        WHERE t.role_event_id IS NOT NULL
+        UNION ALL
+        SELECT t.role_event_id, s.id, 'bio'
+        FROM tmp_excel_role_row t
+        JOIN source_document s ON s.url = t.bio_url
+        WHERE t.role_event_id IS NOT NULL
+        ON CONFLICT DO NOTHING
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO person_source_document (person_id, source_document_id, relation_type)
+        SELECT t.person_id, s.id, 'appointment'
+        FROM tmp_excel_role_row t
+        JOIN source_document s ON s.url = t.appointment_url
+        UNION ALL
+        SELECT t.person_id, s.id, 'bio'
+        FROM tmp_excel_role_row t
+        JOIN source_document s ON s.url = t.bio_url
+        ON CONFLICT DO NOTHING
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO organization_source_document (
+          organization_id, source_document_id, relation_type
         )
-        return
-    if table == "organization_source_document":
-        conn.execute(
-            """
-            INSERT INTO organization_source_document (organization_id, source_document_id, relation_type)
-            VALUES (%s, %s, %s)
-            ON CONFLICT DO NOTHING
-            """,
-            ids,
+        SELECT t.organization_id, s.id, 'appointment'
+        FROM tmp_excel_role_row t
+        JOIN source_document s ON s.url = t.appointment_url
+        UNION ALL
+        SELECT t.organization_id, s.id, 'funding'
+        FROM tmp_excel_role_row t
+        JOIN source_document s ON s.url = t.donor_url
+        ON CONFLICT DO NOTHING
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO funding_flow_source_document (
+          funding_flow_id, source_document_id, relation_type
         )
-        return
-
-    raise ValueError(f"Unknown junction table: {table}")
+        SELECT t.funding_flow_id, s.id, 'donor_report'
+        FROM tmp_excel_role_row t
+        JOIN source_document s ON s.url = t.donor_url
+        WHERE t.funding_flow_id IS NOT NULL
+        ON CONFLICT DO NOTHING
+        """
+    )
 
 
 def main() -> int:
@@ -328,8 +583,12 @@ def main() -> int:
         print("POSTGRES_DSN is required.", file=sys.stderr)
         return 1
 
-    with psycopg.connect(dsn, row_factory=dict_row) as conn:
+    # Default tuple rows: every query here reads one or two columns by position.
+    with psycopg.connect(dsn) as conn:
         conn.autocommit = False
+        # The run is a rerunnable upsert, so there is no need to wait on the WAL
+        # flush at COMMIT.
+        conn.execute("SET LOCAL synchronous_commit = off")
 
         run_id = args.run_id
         if run_id is None:
@@ -345,7 +604,7 @@ def main() -> int:
             if not run_row:
                 print("No successful excel ingest run found.", file=sys.stderr)
                 return 1
-            run_id = int(run_row["id"])
+            run_id = int(run_row[0])
 
         if args.truncate_core:
             conn.execute(
@@ -366,158 +625,52 @@ def main() -> int:
                 """
             )
 
-        org_rows = conn.execute(
-            """
-            SELECT row_payload
-            FROM stg_excel_organisasjoner
-            WHERE ingest_run_id = %s
-            ORDER BY excel_row
-            """,
-            (run_id,),
-        ).fetchall()
-
-        datakilde_rows = conn.execute(
-            """
-            SELECT row_payload
-            FROM stg_excel_datakilder
-            WHERE ingest_run_id = %s
-            ORDER BY excel_row
-            """,
-            (run_id,),
-        ).fetchall()
-
-        persons_created = 0
-        orgs_created = 0
-        roles_created = 0
-        funding_created = 0
-        sources_created = 0
-
-        # Register datakilde URLs as source documents.
-        for row in datakilde_rows:
-            payload = row["row_payload"]
-            url = clean_text(payload.get("URL"))
-            source_title = clean_text(payload.get("Datakilde"))
-            if not url or not url.startswith("http"):
-                continue
-
-            source_id = ensure_source_document(
-                conn,
-                url=url,
-                doc_type="catalog",
-                source_name=source_title or source_name_for_url(url),
+        # Named (server-side) cursor: payloads stream in itersize chunks and are
+        # parsed as they arrive; only the parsed RoleRows stay resident.
+        with conn.cursor(name="stg_excel_organisasjoner_rows") as cur:
+            cur.itersize = 1000
+            cur.execute(
+                """
+                SELECT row_payload
+                FROM stg_excel_organisasjoner
+                WHERE ingest_run_id = %s
+                ORDER BY excel_row
+                """,
+                (run_id,),
             )
-            if source_id:
-                sources_created += 1
-
-        for row in org_rows:
-            payload = row["row_payload"]
-
-            org_name = clean_text(payload.get("Organisasjon"))
-            person_name = clean_text(payload.get("Norsk toppperson"))
-            role_title = clean_text(payload.get("Rolle/tittel"))
-
-            if not org_name or not person_name or not role_title:
-                continue
-
-            org_type = clean_text(payload.get("Type"))
-            hq_country = clean_text(payload.get("Hovedsete/land"))
-            role_level = clean_text(payload.get("Nivå"))
-            norwegian_position_before = clean_text(payload.get("Norsk posisjon før (kort)"))
-            announced_on = parse_date(payload.get("Dato kunngjort/valgt"))
-            start_on = parse_date(payload.get("Tiltredelse"))
-            end_on = parse_date(payload.get("Slutt"))
-
-            person_id = ensure_person(conn, person_name)
-            org_id = ensure_organization(conn, org_name, org_type, hq_country)
-
-            # Track rough creation activity via existence checks.
-            if conn.execute("SELECT 1 FROM person WHERE id = %s", (person_id,)).fetchone():
-                persons_created += 1
-            if conn.execute("SELECT 1 FROM organization WHERE id = %s", (org_id,)).fetchone():
-                orgs_created += 1
-
-            role_event_id = ensure_role_event(
-                conn,
-                person_id=person_id,
-                organization_id=org_id,
-                role_title=role_title,
-                role_level=role_level,
-                norwegian_position_before=norwegian_position_before,
-                announced_on=announced_on,
-                start_on=start_on,
-                end_on=end_on,
+            role_rows = [
+                role for (payload,) in cur if (role := parse_role_row(payload)) is not None
+            ]
+
+        datakilde_payloads = [
+            payload
+            for (payload,) in conn.execute(
+                """
+                SELECT row_payload
+                FROM stg_excel_datakilder
+                WHERE ingest_run_id = %s
+                ORDER BY excel_row
+                """,
+                (run_id,),
             )
-            roles_created += 1
-
-            appointment_url = clean_text(payload.get("Primærkilde: utnevnelse/valg (URL)"))
-            bio_url = clean_text(payload.get("Primærkilde: bio/rolle (URL)"))
-            donor_url = clean_text(payload.get("Primærkilde: bidrag/donoroversikt (URL)"))
-
-            if appointment_url and appointment_url.startswith("http"):
-                source_id = ensure_source_document(
-                    conn,
-                    url=appointment_url,
-                    doc_type="appointment",
-                    source_name=source_name_for_url(appointment_url),
-                )
-                ensure_junction(
-                    conn,
-                    "role_event_source_document",
-                    (role_event_id, source_id, "appointment"),
-                )
-                ensure_junction(conn, "person_source_document", (person_id, source_id, "appointment"))
-                ensure_junction(
-                    conn,
-                    "organization_source_document",
-                    (org_id, source_id, "appointment"),
-                )
-                sources_created += 1
-
-            if bio_url and bio_url.startswith("http"):
-                source_id = ensure_source_document(
-                    conn,
-                    url=bio_url,
-                    doc_type="bio",
-                    source_name=source_name_for_url(bio_url),
-                )
-                ensure_junction(conn, "role_event_source_document", (role_event_id, source_id, "bio"))
-                ensure_junction(conn, "person_source_document", (person_id, source_id, "bio"))
-                sources_created += 1
-
-            amount_nok = parse_amount_nok(payload.get("Dokumentert beløp (NOK)"))
-            funding_channel = clean_text(payload.get("Bidragskanal (typisk)"))
-            funding_notes = clean_text(payload.get("Beløp – detaljer/forbehold"))
-            fiscal_year = start_on.year if start_on else (announced_on.year if announced_on else None)
-
-            if amount_nok is not None or funding_channel or donor_url:
-                funding_flow_id = ensure_funding_flow(
-                    conn,
-                    recipient_organization_id=org_id,
-                    funding_channel=funding_channel,
-                    amount_nok=amount_nok,
-                    fiscal_year=fiscal_year,
-                    notes=funding_notes,
-                )
-                funding_created += 1
-
-                if donor_url and donor_url.startswith("http"):
-                    source_id = ensure_source_document(
-                        conn,
-                        url=donor_url,
-                        doc_type="funding",
-                        source_name=source_name_for_url(donor_url),
-                    )
-                    ensure_junction(
-                        conn,
-                        "funding_flow_source_document",
-                        (funding_flow_id, source_id, "donor_report"),
-                    )
-                    ensure_junction(
-                        conn,
-                        "organization_source_document",
-                        (org_id, source_id, "funding"),
-                    )
-                    sources_created += 1
+        ]
+
+        source_docs, sources_created = collect_source_documents(datakilde_payloads, role_rows)
+
+        # Everything is resolved set-based: the parsed rows are COPYed into a
+        # temp table and each entity/link table is upserted with one statement,
+        # instead of several round-trips per Excel row. None of the statements
+        # return rows, so they are pipelined rather than awaited one by one.
+        load_staged_roles(conn, role_rows)
+        upsert_source_documents(conn, source_docs)
+        with conn.pipeline():
+            upsert_people_and_organizations(conn)
+            upsert_role_events(conn)
+            upsert_funding_flows(conn)
+            insert_source_links(conn)
+
+        persons_created = orgs_created = roles_created = len(role_rows)
+        funding_created = sum(1 for role in role_rows if role.has_funding)
 
         conn.commit()
 
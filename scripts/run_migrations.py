@@ -5,6 +5,7 @@ import argparse
 import hashlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import psycopg
@@ -22,9 +23,27 @@ def parse_args() -> argparse.Namespace:
 
 
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    digest.update(path.read_bytes())
-    return digest.hexdigest()
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+COPY_HEADER = "-- @copy "
+
+
+def apply_migration(conn: psycopg.Connection, sql: str) -> None:
+    """Run a migration file.
+
+    Pure data files may start with "-- @copy table (col, ...)"; the rest of the
+    file is then CSV streamed through COPY instead of parsed as one statement.
+    """
+    first_line, _, body = sql.partition("\n")
+    if not first_line.startswith(COPY_HEADER):
+        conn.execute(sql)
+        return
+
+    target = first_line[len(COPY_HEADER) :].strip()
+    with conn.cursor().copy(f"COPY {target} FROM STDIN WITH (FORMAT csv)") as copy:
+        copy.write(body)
 
 
 def ensure_migrations_table(conn: psycopg.Connection) -> None:
@@ -58,17 +77,21 @@ def main() -> int:
         print(f"No migration files found in {migrations_dir}")
         return 0
 
+    # hashlib releases the GIL while digesting, so files hash in parallel.
+    with ThreadPoolExecutor() as executor:
+        checksums = dict(zip(files, executor.map(sha256_file, files), strict=True))
+
     with psycopg.connect(dsn) as conn:
         conn.autocommit = False
+        # Serialize concurrent runners. A session-level lock is used because the
+        # migration files COMMIT themselves, which would release an xact lock.
+        conn.execute("SELECT pg_advisory_lock(hashtext('schema_migrations'))")
         ensure_migrations_table(conn)
 
-        applied = {
-            row[0]: row[1]
-            for row in conn.execute("SELECT filename, checksum FROM schema_migrations").fetchall()
-        }
+        applied = dict(conn.execute("SELECT filename, checksum FROM schema_migrations"))
 
         for path in files:
-            checksum = sha256_file(path)
+            checksum = checksums[path]
             existing = applied.get(path.name)
 
             if existing and existing != checksum:
@@ -85,7 +108,7 @@ def main() -> int:
 
             sql = path.read_text(encoding="utf-8")
             print(f"apply {path.name}")
-            conn.execute(sql)
+            apply_migration(conn, sql)
             conn.execute(
                 "INSERT INTO schema_migrations (filename, checksum) VALUES (%s, %s)",
                 (path.name, checksum),
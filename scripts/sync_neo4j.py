@@ -5,15 +5,16 @@ import argparse
 import os
 import re
 import sys
-from datetime import date, datetime
-from decimal import Decimal
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 
 import psycopg
 from dotenv import load_dotenv
-from neo4j import GraphDatabase
-from psycopg.rows import dict_row
+from neo4j import GraphDatabase, Result, RoutingControl
+from psycopg.types.numeric import FloatLoader, NumericBinaryLoader
 
 GRAPH_LABELS = [
     "Person",
@@ -24,6 +25,68 @@ GRAPH_LABELS = [
     "ExternalRecipient",
     "Country",
 ]
+# (label, property) pairs the loaders look nodes up by. Without a uniqueness
+# constraint (and its backing index) each MATCH/MERGE becomes a label scan.
+REQUIRED_UNIQUE_KEYS = [
+    ("Person", "pg_id"),
+    ("Organization", "pg_id"),
+    ("RoleEvent", "pg_id"),
+    ("FundingFlow", "pg_id"),
+    ("SourceDocument", "pg_id"),
+    ("ExternalRecipient", "name_key"),
+    ("Country", "code"),
+]
+UNIQUE_CONSTRAINT_TYPES = {"UNIQUENESS", "NODE_PROPERTY_UNIQUENESS", "NODE_KEY"}
+
+# Tokens that matter when splitting a .cypher file: string literals and
+# backtick-quoted names (which may contain ";"), line comments and ";" itself.
+CYPHER_TOKEN_RE = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|//[^\n]*|;""")
+
+# recipient_name_key computed in SQL: collapse whitespace runs, trim, lowercase.
+# The character class spells out exactly what Python's str.split()/\s treat
+# as whitespace, so keys match those produced by the earlier Python code.
+RECIPIENT_NAME_KEY_SQL = r"""
+    lower(btrim(regexp_replace(
+      recipient_name_raw,
+      '[\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+',
+      ' ',
+      'g'
+    )))
+"""
+# (column, Postgres type) for the two widest tables, read with binary COPY.
+ROLE_EVENT_COLUMNS = (
+    ("id", "int8"),
+    ("person_id", "int8"),
+    ("organization_id", "int8"),
+)
+# RoleEvent node properties, sent as one row.props map per row.
+ROLE_EVENT_PROPS = (
+    ("role_title", "text"),
+    ("role_level", "text"),
+    ("norwegian_position_before", "text"),
+    ("announced_on", "date"),
+    ("start_on", "date"),
+    ("end_on", "date"),
+    ("confidence", "numeric"),
+)
+FUNDING_FLOW_COLUMNS = (
+    ("id", "int8"),
+    ("donor_organization_id", "int8"),
+    ("donor_country_code", "bpchar"),
+    ("recipient_organization_id", "int8"),
+    ("recipient_name_raw", "text"),
+)
+# FundingFlow node properties, sent as one row.props map per row.
+FUNDING_FLOW_PROPS = (
+    ("funding_channel", "text"),
+    ("amount_nok", "numeric"),
+    ("amount_original", "numeric"),
+    ("currency_code", "bpchar"),
+    ("fiscal_year", "int4"),
+    ("period_start", "date"),
+    ("period_end", "date"),
+    ("confidence", "numeric"),
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -54,37 +117,108 @@ def parse_args() -> argparse.Namespace:
 
 def split_cypher_statements(text: str) -> list[str]:
     statements: list[str] = []
-    for part in text.split(";"):
-        statement = part.strip()
-        if statement:
-            statements.append(statement)
+    parts: list[str] = []
+    position = 0
+    for match in CYPHER_TOKEN_RE.finditer(text):
+        token = match.group()
+        parts.append(text[position : match.start()])
+        position = match.end()
+        if token == ";":
+            statement = "".join(parts).strip()
+            if statement:
+                statements.append(statement)
+            parts = []
+        elif not token.startswith("//"):
+            parts.append(token)
+    statement = "".join(parts + [text[position:]]).strip()
+    if statement:
+        statements.append(statement)
     return statements
 
 
-def normalize_for_neo4j(value: Any) -> Any:
-    if value is None:
-        return None
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    if isinstance(value, Decimal):
-        return float(value)
-    return value
+class FloatNumericBinaryLoader(NumericBinaryLoader):
+    """Load binary numeric as float; the Neo4j driver cannot send Decimal."""
+
+    def load(self, data: Any) -> float:
+        return float(super().load(data))
+
+
+def connect_postgres(dsn: str) -> psycopg.Connection:
+    """Connect with numeric loaded as float, so rows can go to Neo4j unconverted.
+
+    Dates and timestamps stay Python date/datetime values and are stored as
+    native Neo4j temporal properties.
+    """
+    conn = psycopg.connect(dsn)
+    conn.adapters.register_loader("numeric", FloatLoader)
+    conn.adapters.register_loader("numeric", FloatNumericBinaryLoader)
+    return conn
+
+
+def chunked(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
 
+def interned_dict_row(cursor: psycopg.Cursor[Any]) -> Any:
+    """dict_row factory whose keys are interned column names.
 
-def chunked(rows: list[dict[str, Any]], size: int) -> Iterable[list[dict[str, Any]]]:
-    for i in range(0, len(rows), size):
-        yield rows[i : i + size]
+    Every row of a streamed query then shares the same key strings, however
+    often psycopg rebuilds its column names between FETCHes.
+    """
+    names = [sys.intern(column.name) for column in cursor.description or ()]
 
+    def make_row(values: Any) -> dict[str, Any]:
+        return dict(zip(names, values, strict=True))
 
-def convert_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    converted: list[dict[str, Any]] = []
-    for row in rows:
-        converted.append({k: normalize_for_neo4j(v) for k, v in row.items()})
-    return converted
+    return make_row
 
 
-def fetch_rows(conn: psycopg.Connection, query: str) -> list[dict[str, Any]]:
-    return [dict(r) for r in conn.execute(query).fetchall()]
+def iter_rows(conn: psycopg.Connection, query: str, itersize: int) -> Iterator[dict[str, Any]]:
+    """Stream query rows through a named (server-side) cursor."""
+    with conn.cursor(name="sync_neo4j_rows", row_factory=interned_dict_row) as cur:
+        cur.itersize = itersize
+        cur.execute(query)
+        yield from cur
+
+
+def copy_rows(
+    conn: psycopg.Connection,
+    table: str,
+    columns: tuple[tuple[str, str], ...],
+    where: str = "",
+    computed: tuple[tuple[str, str, str], ...] = (),
+    props: tuple[tuple[str, str], ...] = (),
+) -> Iterator[dict[str, Any]]:
+    """Stream rows of a wide table with binary COPY instead of a cursor.
+
+    computed holds extra (name, Postgres type, SQL expression) output columns.
+    props columns are nested under row["props"], for a single `SET n += row.props`.
+    """
+    names = [name for name, _ in columns] + [name for name, _, _ in computed]
+    prop_names = [name for name, _ in props]
+    select_list = ", ".join(
+        [name for name, _ in columns]
+        + [f"{expr} AS {name}" for name, _, expr in computed]
+        + prop_names
+    )
+    query = f"COPY (SELECT {select_list} FROM {table} {where}) TO STDOUT (FORMAT BINARY)"
+    with conn.cursor().copy(query) as copy:
+        copy.set_types(
+            [pg_type for _, pg_type in columns]
+            + [t for _, t, _ in computed]
+            + [pg_type for _, pg_type in props]
+        )
+        split = len(names)
+        if not props:
+            for record in copy.rows():
+                yield dict(zip(names, record, strict=True))
+            return
+        for record in copy.rows():
+            row = dict(zip(names, record[:split], strict=True))
+            row["props"] = dict(zip(prop_names, record[split:], strict=True))
+            yield row
 
 
 def apply_constraints(session, file_path: Path) -> None:
@@ -94,14 +228,72 @@ def apply_constraints(session, file_path: Path) -> None:
         session.run(statement).consume()
 
 
+def missing_unique_keys(session) -> list[str]:
+    present = {
+        (record["labelsOrTypes"][0], record["properties"][0])
+        for record in session.run("SHOW CONSTRAINTS YIELD type, labelsOrTypes, properties")
+        if record["type"] in UNIQUE_CONSTRAINT_TYPES
+        and len(record["labelsOrTypes"]) == 1
+        and len(record["properties"]) == 1
+    }
+    return [
+        f":{label}({prop})" for label, prop in REQUIRED_UNIQUE_KEYS if (label, prop) not in present
+    ]
+
+
 def purge_graph(session) -> None:
     for label in GRAPH_LABELS:
         session.run(f"MATCH (n:{label}) DETACH DELETE n").consume()
 
 
-def execute_in_batches(session, query: str, rows: list[dict[str, Any]], batch_size: int) -> None:
-    for batch in chunked(rows, batch_size):
-        session.run(query, rows=batch).consume()
+def execute_in_batches(
+    driver, database: str, query: str, rows: Iterable[dict[str, Any]], batch_size: int
+) -> None:
+    # One batch is written in the background while the next one is read from
+    # Postgres, so the fetch overlaps the Neo4j round trip. Waiting for the
+    # previous write before submitting keeps batches in order.
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        pending = None
+        for batch in chunked(rows, batch_size):
+            if pending is not None:
+                pending.result()
+            # execute_query runs a managed write transaction on a pooled
+            # session: transient failures such as lock deadlocks are retried
+            # with backoff, and there is no session lifecycle to manage per
+            # call. Naming the database up front saves a home-database lookup.
+            pending = writer.submit(
+                driver.execute_query,
+                query,
+                rows=batch,
+                database_=database,
+                routing_=RoutingControl.WRITE,
+                result_transformer_=Result.consume,
+            )
+        if pending is not None:
+            pending.result()
+
+
+def load_in_parallel(
+    driver, database: str, dsn: str, loads: list[tuple[str, str]], batch_size: int
+) -> None:
+    """Run independent (cypher, sql) loads concurrently.
+
+    Each load gets its own Postgres connection, since a connection cannot
+    stream two cursors at once; the driver itself is thread-safe. Only use
+    this for loads that touch disjoint labels or rarely the same nodes, so
+    they seldom contend on node locks.
+    """
+
+    def run(load: tuple[str, str]) -> None:
+        cypher, sql = load
+        with connect_postgres(dsn) as conn:
+            execute_in_batches(
+                driver, database, cypher, iter_rows(conn, sql, batch_size), batch_size
+            )
+
+    with ThreadPoolExecutor(max_workers=len(loads)) as executor:
+        # list() re-raises the first failed load here.
+        list(executor.map(run, loads))
 
 
 def main() -> int:
@@ -116,6 +308,7 @@ def main() -> int:
     neo4j_uri = os.getenv("NEO4J_URI")
     neo4j_user = os.getenv("NEO4J_USER")
     neo4j_password = os.getenv("NEO4J_PASSWORD")
+    neo4j_database = os.getenv("NEO4J_DATABASE", "neo4j")
     if not all([neo4j_uri, neo4j_user, neo4j_password]):
         print("NEO4J_URI, NEO4J_USER, and NEO4J_PASSWORD are required.", file=sys.stderr)
         return 1
@@ -126,289 +319,268 @@ def main() -> int:
         return 1
 
     with GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password)) as driver:
-        with driver.session() as session:
+        with driver.session(database=neo4j_database) as session:
             apply_constraints(session, constraints_file)
 
             if args.init_only:
                 print("Neo4j constraints/indexes applied.")
                 return 0
 
-            if args.purge:
-                purge_graph(session)
-
-            with psycopg.connect(dsn, row_factory=dict_row) as conn:
-                person_rows = convert_rows(
-                    fetch_rows(conn, "SELECT id, canonical_name, country_code FROM person")
-                )
-                org_rows = convert_rows(
-                    fetch_rows(conn, "SELECT id, canonical_name, org_type, hq_country FROM organization")
-                )
-                source_rows = convert_rows(
-                    fetch_rows(
-                        conn,
-                        """
-                        SELECT id, source_name, url, doc_type, published_at, retrieved_at
-                        FROM source_document
-                        """,
-                    )
-                )
-                role_rows = convert_rows(
-                    fetch_rows(
-                        conn,
-                        """
-                        SELECT id, person_id, organization_id, role_title, role_level,
-                               norwegian_position_before, announced_on, start_on, end_on,
-                               confidence
-                        FROM role_event
-                        """,
-                    )
-                )
-                funding_rows = convert_rows(
-                    fetch_rows(
-                        conn,
-                        """
-                        SELECT id, donor_organization_id, donor_country_code,
-                               recipient_organization_id, recipient_name_raw,
-                               funding_channel, amount_nok, amount_original,
-                               currency_code, fiscal_year, period_start, period_end,
-                               confidence
-                        FROM funding_flow
-                        """,
-                    )
-                )
-                role_source_rows = convert_rows(
-                    fetch_rows(
-                        conn,
-                        """
-                        SELECT role_event_id, source_document_id, relation_type
-                        FROM role_event_source_document
-                        """,
-                    )
-                )
-                funding_source_rows = convert_rows(
-                    fetch_rows(
-                        conn,
-                        """
-                        SELECT funding_flow_id, source_document_id, relation_type
-                        FROM funding_flow_source_document
-                        """,
-                    )
+            missing = missing_unique_keys(session)
+            if missing:
+                print(
+                    "Missing Neo4j uniqueness constraints for "
+                    f"{', '.join(missing)}; check {constraints_file}.",
+                    file=sys.stderr,
                 )
+                return 1
 
-            execute_in_batches(
-                session,
-                """
-                UNWIND $rows AS row
-                MERGE (p:Person {pg_id: row.id})
-                SET p.name = row.canonical_name,
-                    p.country_code = row.country_code
-                """,
-                person_rows,
-                args.batch_size,
-            )
-
-            execute_in_batches(
-                session,
-                """
-                UNWIND $rows AS row
-                MERGE (o:Organization {pg_id: row.id})
-                SET o.name = row.canonical_name,
-                    o.org_type = row.org_type,
-                    o.hq_country = row.hq_country
-                """,
-                org_rows,
-                args.batch_size,
-            )
-
-            execute_in_batches(
-                session,
-                """
-                UNWIND $rows AS row
-                MERGE (s:SourceDocument {pg_id: row.id})
-                SET s.source_name = row.source_name,
-                    s.url = row.url,
-                    s.doc_type = row.doc_type,
-                    s.published_at = row.published_at,
-                    s.retrieved_at = row.retrieved_at
-                """,
-                source_rows,
-                args.batch_size,
-            )
+            if args.purge:
+                purge_graph(session)
 
+        batch_size = args.batch_size
+
+        # Person, Organization, SourceDocument, Country and ExternalRecipient
+        # nodes do not depend on each other, so they load side by side. Country
+        # and ExternalRecipient come from the distinct funding_flow values, so
+        # the funding loaders below only MATCH them instead of MERGE-ing them
+        # once per row.
+        load_in_parallel(
+            driver,
+            neo4j_database,
+            dsn,
+            [
+                (
+                    """
+                    UNWIND $rows AS row
+                    MERGE (p:Person {pg_id: row.id})
+                    SET p.name = row.canonical_name,
+                        p.country_code = row.country_code
+                    """,
+                    "SELECT id, canonical_name, country_code FROM person",
+                ),
+                (
+                    """
+                    UNWIND $rows AS row
+                    MERGE (o:Organization {pg_id: row.id})
+                    SET o.name = row.canonical_name,
+                        o.org_type = row.org_type,
+                        o.hq_country = row.hq_country
+                    """,
+                    "SELECT id, canonical_name, org_type, hq_country FROM organization",
+                ),
+                (
+                    """
+                    UNWIND $rows AS row
+                    MERGE (s:SourceDocument {pg_id: row.id})
+                    SET s.source_name = row.source_name,
+                        s.url = row.url,
+                        s.doc_type = row.doc_type,
+                        s.published_at = row.published_at,
+                        s.retrieved_at = row.retrieved_at
+                    """,
+                    """
+                    SELECT id, source_name, url, doc_type, published_at, retrieved_at
+                    FROM source_document
+                    """,
+                ),
+                (
+                    """
+                    UNWIND $rows AS row
+                    MERGE (:Country {code: row.donor_country_code})
+                    """,
+                    """
+                    SELECT DISTINCT donor_country_code
+                    FROM funding_flow
+                    WHERE donor_organization_id IS NULL
+                      AND donor_country_code IS NOT NULL
+                      AND (recipient_organization_id IS NOT NULL OR recipient_name_raw <> '')
+                    """,
+                ),
+                (
+                    """
+                    UNWIND $rows AS row
+                    MERGE (e:ExternalRecipient {name_key: row.recipient_name_key})
+                    SET e.name = row.recipient_name_raw
+                    """,
+                    f"""
+                    SELECT DISTINCT ON (recipient_name_key) recipient_name_key, recipient_name_raw
+                    FROM (
+                      SELECT id, recipient_name_raw, {RECIPIENT_NAME_KEY_SQL} AS recipient_name_key
+                      FROM funding_flow
+                      WHERE recipient_organization_id IS NULL
+                        AND recipient_name_raw <> ''
+                        AND (donor_organization_id IS NOT NULL OR donor_country_code IS NOT NULL)
+                    ) AS recipient
+                    ORDER BY recipient_name_key, id DESC
+                    """,
+                ),
+            ],
+            batch_size,
+        )
+
+        # The remaining loaders MATCH those nodes, so they run in order. Rows
+        # stream from server-side cursors straight into the Neo4j batches.
+        with connect_postgres(dsn) as conn:
             execute_in_batches(
-                session,
+                driver,
+                neo4j_database,
                 """
                 UNWIND $rows AS row
                 MATCH (p:Person {pg_id: row.person_id})
                 MATCH (o:Organization {pg_id: row.organization_id})
                 MERGE (r:RoleEvent {pg_id: row.id})
-                SET r.role_title = row.role_title,
-                    r.role_level = row.role_level,
-                    r.norwegian_position_before = row.norwegian_position_before,
-                    r.announced_on = row.announced_on,
-                    r.start_on = row.start_on,
-                    r.end_on = row.end_on,
-                    r.confidence = row.confidence
+                SET r += row.props
                 MERGE (p)-[:HELD_ROLE]->(r)
                 MERGE (r)-[:AT_ORGANIZATION]->(o)
                 """,
-                role_rows,
-                args.batch_size,
+                copy_rows(conn, "role_event", ROLE_EVENT_COLUMNS, props=ROLE_EVENT_PROPS),
+                batch_size,
             )
 
-            donor_org_recipient_org = [
-                row
-                for row in funding_rows
-                if row.get("donor_organization_id") is not None
-                and row.get("recipient_organization_id") is not None
-            ]
-            donor_org_recipient_external = []
-            for row in funding_rows:
-                if row.get("donor_organization_id") is None:
-                    continue
-                if row.get("recipient_organization_id") is not None:
-                    continue
-                recipient_raw = row.get("recipient_name_raw")
-                if not recipient_raw:
-                    continue
-                row["recipient_name_key"] = re.sub(r"\s+", " ", str(recipient_raw).strip().lower())
-                donor_org_recipient_external.append(row)
-
-            donor_country_recipient_org = [
-                row
-                for row in funding_rows
-                if row.get("donor_organization_id") is None
-                and row.get("donor_country_code") is not None
-                and row.get("recipient_organization_id") is not None
-            ]
-            donor_country_recipient_external = []
-            for row in funding_rows:
-                if row.get("donor_organization_id") is not None:
-                    continue
-                if row.get("donor_country_code") is None:
-                    continue
-                if row.get("recipient_organization_id") is not None:
-                    continue
-                recipient_raw = row.get("recipient_name_raw")
-                if not recipient_raw:
-                    continue
-                row["recipient_name_key"] = re.sub(r"\s+", " ", str(recipient_raw).strip().lower())
-                donor_country_recipient_external.append(row)
-
+            # Funding flows are split into the four donor/recipient shapes in SQL,
+            # one streamed query per Cypher loader.
             execute_in_batches(
-                session,
+                driver,
+                neo4j_database,
                 """
                 UNWIND $rows AS row
                 MATCH (d:Organization {pg_id: row.donor_organization_id})
                 MATCH (rorg:Organization {pg_id: row.recipient_organization_id})
                 MERGE (f:FundingFlow {pg_id: row.id})
-                SET f.funding_channel = row.funding_channel,
-                    f.amount_nok = row.amount_nok,
-                    f.amount_original = row.amount_original,
-                    f.currency_code = row.currency_code,
-                    f.fiscal_year = row.fiscal_year,
-                    f.period_start = row.period_start,
-                    f.period_end = row.period_end,
-                    f.confidence = row.confidence
+                SET f += row.props
                 MERGE (d)-[:FUNDED]->(f)
                 MERGE (f)-[:TO_ORGANIZATION]->(rorg)
                 """,
-                donor_org_recipient_org,
-                args.batch_size,
+                copy_rows(
+                    conn,
+                    "funding_flow",
+                    FUNDING_FLOW_COLUMNS,
+                    """
+                    WHERE donor_organization_id IS NOT NULL
+                      AND recipient_organization_id IS NOT NULL
+                    """,
+                    props=FUNDING_FLOW_PROPS,
+                ),
+                batch_size,
             )
 
             execute_in_batches(
-                session,
+                driver,
+                neo4j_database,
                 """
                 UNWIND $rows AS row
                 MATCH (d:Organization {pg_id: row.donor_organization_id})
-                MERGE (e:ExternalRecipient {name_key: row.recipient_name_key})
-                SET e.name = row.recipient_name_raw
+                MATCH (e:ExternalRecipient {name_key: row.recipient_name_key})
                 MERGE (f:FundingFlow {pg_id: row.id})
-                SET f.funding_channel = row.funding_channel,
-                    f.amount_nok = row.amount_nok,
-                    f.amount_original = row.amount_original,
-                    f.currency_code = row.currency_code,
-                    f.fiscal_year = row.fiscal_year,
-                    f.period_start = row.period_start,
-                    f.period_end = row.period_end,
-                    f.confidence = row.confidence
+                SET f += row.props
                 MERGE (d)-[:FUNDED]->(f)
                 MERGE (f)-[:TO_EXTERNAL_RECIPIENT]->(e)
                 """,
-                donor_org_recipient_external,
-                args.batch_size,
+                copy_rows(
+                    conn,
+                    "funding_flow",
+                    FUNDING_FLOW_COLUMNS,
+                    """
+                    WHERE donor_organization_id IS NOT NULL
+                      AND recipient_organization_id IS NULL
+                      AND recipient_name_raw <> ''
+                    """,
+                    computed=(("recipient_name_key", "text", RECIPIENT_NAME_KEY_SQL),),
+                    props=FUNDING_FLOW_PROPS,
+                ),
+                batch_size,
             )
 
             execute_in_batches(
-                session,
+                driver,
+                neo4j_database,
                 """
                 UNWIND $rows AS row
-                MERGE (c:Country {code: row.donor_country_code})
-                WITH row, c
+                MATCH (c:Country {code: row.donor_country_code})
                 MATCH (rorg:Organization {pg_id: row.recipient_organization_id})
                 MERGE (f:FundingFlow {pg_id: row.id})
-                SET f.funding_channel = row.funding_channel,
-                    f.amount_nok = row.amount_nok,
-                    f.amount_original = row.amount_original,
-                    f.currency_code = row.currency_code,
-                    f.fiscal_year = row.fiscal_year,
-                    f.period_start = row.period_start,
-                    f.period_end = row.period_end,
-                    f.confidence = row.confidence
+                SET f += row.props
                 MERGE (c)-[:FUNDED]->(f)
                 MERGE (f)-[:TO_ORGANIZATION]->(rorg)
                 """,
-                donor_country_recipient_org,
-                args.batch_size,
+                copy_rows(
+                    conn,
+                    "funding_flow",
+                    FUNDING_FLOW_COLUMNS,
+                    """
+                    WHERE donor_organization_id IS NULL
+                      AND donor_country_code IS NOT NULL
+                      AND recipient_organization_id IS NOT NULL
+                    """,
+                    props=FUNDING_FLOW_PROPS,
+                ),
+                batch_size,
             )
 
             execute_in_batches(
-                session,
+                driver,
+                neo4j_database,
                 """
                 UNWIND $rows AS row
-                MERGE (c:Country {code: row.donor_country_code})
-                MERGE (e:ExternalRecipient {name_key: row.recipient_name_key})
-                SET e.name = row.recipient_name_raw
+                MATCH (c:Country {code: row.donor_country_code})
+                MATCH (e:ExternalRecipient {name_key: row.recipient_name_key})
                 MERGE (f:FundingFlow {pg_id: row.id})
-                SET f.funding_channel = row.funding_channel,
-                    f.amount_nok = row.amount_nok,
-                    f.amount_original = row.amount_original,
-                    f.currency_code = row.currency_code,
-                    f.fiscal_year = row.fiscal_year,
-                    f.period_start = row.period_start,
-                    f.period_end = row.period_end,
-                    f.confidence = row.confidence
+                SET f += row.props
                 MERGE (c)-[:FUNDED]->(f)
                 MERGE (f)-[:TO_EXTERNAL_RECIPIENT]->(e)
                 """,
-                donor_country_recipient_external,
-                args.batch_size,
+                copy_rows(
+                    conn,
+                    "funding_flow",
+                    FUNDING_FLOW_COLUMNS,
+                    """
+                    WHERE donor_organization_id IS NULL
+                      AND donor_country_code IS NOT NULL
+                      AND recipient_organization_id IS NULL
+                      AND recipient_name_raw <> ''
+                    """,
+                    computed=(("recipient_name_key", "text", RECIPIENT_NAME_KEY_SQL),),
+                    props=FUNDING_FLOW_PROPS,
+                ),
+                batch_size,
             )
 
-            execute_in_batches(
-                session,
-                """
-                UNWIND $rows AS row
-                MATCH (r:RoleEvent {pg_id: row.role_event_id})
-                MATCH (s:SourceDocument {pg_id: row.source_document_id})
-                MERGE (r)-[rel:SUPPORTED_BY {relation_type: row.relation_type}]->(s)
-                """,
-                role_source_rows,
-                args.batch_size,
-            )
-
-            execute_in_batches(
-                session,
-                """
-                UNWIND $rows AS row
-                MATCH (f:FundingFlow {pg_id: row.funding_flow_id})
-                MATCH (s:SourceDocument {pg_id: row.source_document_id})
-                MERGE (f)-[rel:SUPPORTED_BY {relation_type: row.relation_type}]->(s)
-                """,
-                funding_source_rows,
-                args.batch_size,
-            )
+        # The two SUPPORTED_BY edge tables are the largest and only share
+        # SourceDocument end nodes, so they load side by side as well; the
+        # occasional lock conflict on a shared document is retried.
+        load_in_parallel(
+            driver,
+            neo4j_database,
+            dsn,
+            [
+                (
+                    """
+                    UNWIND $rows AS row
+                    MATCH (r:RoleEvent {pg_id: row.role_event_id})
+                    MATCH (s:SourceDocument {pg_id: row.source_document_id})
+                    MERGE (r)-[rel:SUPPORTED_BY {relation_type: row.relation_type}]->(s)
+                    """,
+                    """
+                    SELECT role_event_id, source_document_id, relation_type
+                    FROM role_event_source_document
+                    """,
+                ),
+                (
+                    """
+                    UNWIND $rows AS row
+                    MATCH (f:FundingFlow {pg_id: row.funding_flow_id})
+                    MATCH (s:SourceDocument {pg_id: row.source_document_id})
+                    MERGE (f)-[rel:SUPPORTED_BY {relation_type: row.relation_type}]->(s)
+                    """,
+                    """
+                    SELECT funding_flow_id, source_document_id, relation_type
+                    FROM funding_flow_source_document
+                    """,
+                ),
+            ],
+            batch_size,
+        )
 
     print("Neo4j sync complete.")
     return 0